@@ -1,7 +1,7 @@
 # root_finder_ui.py
+import time
 import streamlit as st
 import numpy as np
-from sympy import symbols, sympify, lambdify, diff
 
 from methods.graphical import graphical_ui
 from methods.incremental import incremental_ui
@@ -9,6 +9,12 @@ from methods.bisection import bisection_ui
 from methods.regula_falsi import regula_falsi_ui
 from methods.newton_raphson import newton_raphson_ui
 from methods.secant import secant_ui
+from methods.sweep import sweep_ui
+from methods.systems import system_ui
+from methods.interval_newton import interval_newton_ui
+from methods.chebyshev import chebyshev_ui
+from methods.expression import compile_expression
+from methods.telemetry import CountingFunction, record_run
 
 st.set_page_config(page_title="Root Finder", layout="wide", page_icon="🔎")
 
@@ -135,7 +141,11 @@ with col1:
         "Bisection": "BISECTION METHOD",
         "False": "FALSE POSITION METHOD",
         "Newton": "NEWTON RAPHSON METHOD",
-        "Secant": "SECANT METHOD"
+        "Secant": "SECANT METHOD",
+        "Sweep": "PARAMETER SWEEP",
+        "System": "NONLINEAR SYSTEM",
+        "Interval": "INTERVAL NEWTON METHOD",
+        "Chebyshev": "CHEBYSHEV PROXY METHOD"
     }
 
     for key, label in method_labels.items():
@@ -161,21 +171,28 @@ with st.expander("ℹ️ Direction"):
     - Input the function in Python format, e.g. `x**2 - 4`.<br>
     - Set the interval for root-finding.<br>
     - Click one or more method buttons to prepare.<br>
+    - For a parameter sweep, write f in terms of x and a parameter symbol (default `p`), e.g. `x**2 - p`.<br>
+    - For a nonlinear system, enter one equation per line; starting points span the interval on every axis.<br>
     - Click "Run Root-Finding" to see individual results and root summaries.
     </div>
     """, unsafe_allow_html=True)
 
 # --- Main Execution ---
 if run:
-    x = symbols('x')
-    try:
-        f_expr = sympify(f_expr_input)
-        f = lambdify(x, f_expr, modules='numpy')
-        df_expr = diff(f_expr, x)
-        df = lambdify(x, df_expr, 'numpy')
-    except Exception as e:
-        st.error(f"❌ Invalid function: {e}")
-        st.stop()
+    f = df = f_expr = df_expr = None
+    admission_error = None
+    one_dimensional = [m for m in st.session_state.selected_methods if m not in ("Sweep", "System")]
+    if one_dimensional:
+        try:
+            f, df, f_expr, df_expr = compile_expression(f_expr_input)
+            f, df = CountingFunction(f), CountingFunction(df)
+        except Exception as e:
+            admission_error = str(e)
+            record_run("Admission", f_expr_input, (x_start, x_end), "rejected", 0.0, error=admission_error)
+            st.error(f"❌ Invalid function: {e}")
+            # Sweep and system input is compiled by those methods themselves, so they can still run
+            if len(one_dimensional) == len(st.session_state.selected_methods):
+                st.stop()
 
     x_range = (x_start, x_end)
     all_roots = []
@@ -187,19 +204,34 @@ if run:
         "False": ("📐 Regula Falsi Method", lambda: regula_falsi_ui(f, x_range)),
         "Newton": ("📉 Newton–Raphson Method", lambda: newton_raphson_ui(f, df, x_range)),
         "Secant": ("📏 Secant Method", lambda: secant_ui(f, x_range)),
+        "Sweep": ("🔁 Parameter Sweep", lambda: sweep_ui(f_expr_input, x_range)),
+        "System": ("🧩 Nonlinear System", lambda: system_ui(x_range)),
+        "Interval": ("🛡️ Interval Newton Method", lambda: interval_newton_ui(f, f_expr, df_expr, x_range)),
+        "Chebyshev": ("🧮 Chebyshev Proxy Method", lambda: chebyshev_ui(f, df, x_range)),
     }
 
     for method in st.session_state.selected_methods:
         title, func = method_ui[method]
         st.markdown(f"<h3 style='color:#ff00ff;'>{title}</h3>", unsafe_allow_html=True)
+        if admission_error is not None and method in one_dimensional:
+            st.warning(f"⚠️ Skipped: f(x) was not admitted ({admission_error}).")
+            continue
+        if f is not None:
+            f.reset()
+            df.reset()
+        start = time.perf_counter()
         try:
-            roots = func()
+            roots, stats = func()
+            wall_time = time.perf_counter() - start
+            record_run(method, f_expr_input, x_range, "roots" if roots else "no_roots", wall_time,
+                       stats["solve_time"], stats["iterations"], stats["evaluations"], len(roots))
             if roots:
                 st.success(f"✅ Found {len(roots)} root(s).")
                 all_roots += roots
             else:
                 st.warning("⚠️ No roots found.")
         except Exception as e:
+            record_run(method, f_expr_input, x_range, "error", time.perf_counter() - start, error=str(e))
             st.error(f"❌ {method} failed: {e}")
 
     st.markdown("---")
@@ -1,8 +1,12 @@
+import time
 import numpy as np
 import pandas as pd
 import streamlit as st
-import matplotlib.pyplot as plt
-import matplotlib.cm as cm
+
+from methods.export import trace_download_ui
+from methods.plotting import cyberpunk_plot, plot_function_roots
+
+BISECTION_COLUMNS = ["Iteration", "Xl", "Xu", "Midpoint", "f(Xl)", "f(Xu)", "f(Midpoint)", "Remark"]
 
 def bisection_method(f, x_range, tol=1e-5, max_iter=100):
     a, b = x_range
@@ -10,7 +14,8 @@ def bisection_method(f, x_range, tol=1e-5, max_iter=100):
     rows = []
     iteration = 1
 
-    if f(a) * f(b) > 0:
+    fa0, fb0 = f(a), f(b)
+    if fa0 * fb0 > 0:
         return roots, rows
 
     while (b - a) / 2 > tol and iteration <= max_iter:
@@ -31,13 +36,27 @@ def bisection_method(f, x_range, tol=1e-5, max_iter=100):
 
         rows.append([iteration, a, b, c, fa, fb, fc, remark])
         iteration += 1
+        if roots:
+            break
+
+    if not roots and (b - a) / 2 <= tol:
+        # Bracket shrank below tol without |f| dropping below it: a steep root if f shrank on the
+        # way in, a pole (tan, 1/x) if it grew past the values it started from
+        c = (a + b) / 2
+        fc = f(c)
+        if abs(fc) <= 1e-3 * max(abs(fa0), abs(fb0)):
+            roots.append(c)
+            rows.append([iteration, a, b, c, f(a), f(b), fc, 'Root found'])
+        else:
+            rows.append([iteration, a, b, c, f(a), f(b), fc, 'Sign change without root (pole?)'])
 
     return roots, rows
 
-def bisection_all_roots(f, x_range, step=0.5, tol=1e-5, max_iter=100):
+def bisection_all_roots(f, x_range, step=0.5, tol=1e-5, max_iter=100, sink=None):
     a_start, b_end = x_range
     roots = []
     all_rows = []
+    emit = sink.write_rows if sink is not None else all_rows.extend
 
     current = a_start
     while current < b_end:
@@ -52,19 +71,19 @@ def bisection_all_roots(f, x_range, step=0.5, tol=1e-5, max_iter=100):
         if abs(fa) < tol:
             if not any(abs(a - existing) < tol for existing in roots):
                 roots.append(a)
-                all_rows.append([0, a, b, a, fa, fb, fa, 'Root found at start'])
+                emit([[0, a, b, a, fa, fb, fa, 'Root found at start']])
         elif abs(fb) < tol:
             if not any(abs(b - existing) < tol for existing in roots):
                 roots.append(b)
-                all_rows.append([0, a, b, b, fa, fb, fb, 'Root found at end'])
+                emit([[0, a, b, b, fa, fb, fb, 'Root found at end']])
         elif fa * fb < 0:
             local_roots, rows = bisection_method(f, (a, b), tol, max_iter)
-            all_rows.extend(rows)
+            emit(rows)
             for r in local_roots:
                 if not any(abs(r - existing) < tol for existing in roots):
                     roots.append(r)
         else:
-            all_rows.append([0, a, b, midpoint, fa, fb, fmid, 'No sign change'])
+            emit([[0, a, b, midpoint, fa, fb, fmid, 'No sign change']])
 
         current += step
 
@@ -74,7 +93,10 @@ def bisection_ui(f, x_range):
     tol = 1e-5
     step = 0.5
 
+    start = time.perf_counter()
     roots, table = bisection_all_roots(f, x_range, step, tol)
+    solve_time = time.perf_counter() - start
+    evaluations = f.points
 
     # --- Cyberpunk Summary Card ---
     st.markdown(f"""
@@ -89,38 +111,18 @@ def bisection_ui(f, x_range):
 
     # --- Iteration Table ---
     with st.expander("📋 Bisection Method Iterations"):
-        df = pd.DataFrame(
-            table,
-            columns=["Iteration", "Xl", "Xu", "Midpoint", "f(Xl)", "f(Xu)", "f(Midpoint)", "Remark"]
-        )
+        df = pd.DataFrame(table, columns=BISECTION_COLUMNS)
 
         def highlight_roots(row):
             return ['background-color: #262626'] * len(row) if 'Root' in row["Remark"] else [''] * len(row)
 
         st.dataframe(df.style.apply(highlight_roots, axis=1))
+        trace_download_ui(lambda sink: bisection_all_roots(f, x_range, step, tol, sink=sink), BISECTION_COLUMNS, "bisection")
 
     # --- Plot ---
     X = np.linspace(*x_range, 1000)
     Y = f(X)
 
-    fig, ax = plt.subplots(figsize=(8, 5))
-    fig.patch.set_facecolor('#12122a')
-    ax.set_facecolor('#12122a')
-
-    ax.plot(X, Y, label="f(x)", color="#00fff7", linewidth=2)
-    ax.axhline(0, color='#ff00ff', linestyle='--', linewidth=1)
-
-    cmap = cm.get_cmap('cool', len(roots))
-    for i, root in enumerate(roots):
-        color = cmap(i)
-        ax.plot(root, f(root), 'o', color=color, label=f'Root {i+1}: {root:.4f}')
-        ax.annotate(f'{root:.4f}', (root, f(root)), textcoords="offset points", xytext=(0, 10), ha='center', fontsize=9, color=color)
-
-    ax.set_xlabel("x", fontsize=12, color='#00fff7')
-    ax.set_ylabel("f(x)", fontsize=12, color='#00fff7')
-    ax.set_title("Function Plot with Detected Roots (Bisection)", fontsize=14, weight='bold', color='magenta')
-    ax.tick_params(colors='#00fff7')
-    ax.legend(frameon=False, labelcolor='#ff00ff')
-
-    st.pyplot(fig)
-    return roots
+    with cyberpunk_plot("Function Plot with Detected Roots (Bisection)") as ax:
+        plot_function_roots(ax, f, X, Y, roots, cmap='cool', digits=4)
+    return roots, {"iterations": len(table), "solve_time": solve_time, "evaluations": evaluations}
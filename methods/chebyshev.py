@@ -0,0 +1,183 @@
+import time
+import numpy as np
+import pandas as pd
+import streamlit as st
+from numpy.polynomial import chebyshev as C
+
+from methods.export import trace_download_ui
+from methods.plotting import cyberpunk_plot, plot_function_roots, MAGENTA
+
+CHEBYSHEV_COLUMNS = ["Piece", "a", "b", "Samples", "Degree", "Tail |cₖ|", "Roots", "Remark"]
+
+
+# --- Chebyshev coefficients from values at Chebyshev points, via FFT ---
+def chebyshev_coefficients(values):
+    # values are sampled at x_k = cos(pi k / n), k = 0..n (Chebyshev points of the 2nd kind)
+    n = len(values) - 1
+    if n == 0:
+        return np.array(values, dtype=float)
+    extended = np.concatenate([values, values[-2:0:-1]])
+    coeffs = np.fft.rfft(extended).real[:n + 1] / n
+    coeffs[0] /= 2
+    coeffs[n] /= 2
+    return coeffs
+
+
+def _resolved(coeffs, tol):
+    scale = max(np.max(np.abs(coeffs)), 1e-300)
+    return np.max(np.abs(coeffs[-3:])) <= tol * scale
+
+
+# --- Adaptive piecewise interpolant ---
+def chebyshev_pieces(f, x_range, tol=1e-13, min_degree=16, max_degree=256, max_depth=12):
+    pieces = []
+    evaluations = 0
+    stack = [(x_range[0], x_range[1], 0)]
+
+    while stack:
+        a, b, depth = stack.pop()
+        n = min_degree
+        while True:
+            t = np.cos(np.pi * np.arange(n + 1) / n)
+            values = np.asarray(f((b - a) / 2 * t + (a + b) / 2), dtype=float) * np.ones(n + 1)
+            evaluations += n + 1
+            finite = np.isfinite(values)
+            if not finite.any():
+                # f is undefined on the whole piece: nothing to interpolate, nothing to split
+                break
+            coeffs = chebyshev_coefficients(values) if finite.all() else None
+            if coeffs is not None and _resolved(coeffs, tol):
+                pieces.append((a, b, C.chebtrim(coeffs, tol * np.max(np.abs(coeffs))), n, True))
+                break
+            # A higher degree cannot repair non-finite samples, so such pieces are split straight away
+            if coeffs is not None and n < max_degree:
+                n *= 2
+                continue
+            if depth < max_depth:
+                # Split slightly off-centre so that singular points are unlikely to sit on a piece edge
+                m = a + (b - a) * 0.4990234375
+                stack.append((m, b, depth + 1))
+                stack.append((a, m, depth + 1))
+            elif coeffs is not None:
+                pieces.append((a, b, coeffs, n, False))
+            break
+
+    pieces.sort(key=lambda p: p[0])
+    return pieces, evaluations
+
+
+def _polish(f, df, x, a, b, steps):
+    evaluations = 0
+    for _ in range(steps):
+        fx = f(x)
+        if fx == 0:
+            return x, evaluations + 1, True
+        if df is not None:
+            dfx = df(x)
+            evaluations += 2
+        else:
+            h = 1e-7 * max(1.0, abs(x))
+            dfx = (f(x + h) - f(x - h)) / (2 * h)
+            evaluations += 3
+        if dfx == 0 or not np.isfinite(dfx):
+            break
+        x_new = x - fx / dfx
+        if not a <= x_new <= b:
+            break
+        converged = abs(x_new - x) <= 1e-10 * max(1.0, abs(x))
+        x = x_new
+        if converged:
+            return x, evaluations, True
+    return x, evaluations, False
+
+
+def _small_residual(f, x, a, b):
+    # |f(x)| against |f| a little way either side: spurious roots of a badly scaled piece
+    # (f tiny next to the piece's largest value, but nowhere near zero) fail this
+    h = 1e-3 * (b - a)
+    with np.errstate(all='ignore'):
+        return abs(f(x)) <= 1e-6 * max(abs(f(x - h)), abs(f(x + h)))
+
+
+def chebyshev_roots(f, x_range, df=None, tol=1e-13, polish_steps=30, max_degree=256):
+    pieces, evaluations = chebyshev_pieces(f, x_range, tol, max_degree=max_degree)
+    roots = []
+    rows = []
+
+    for i, (a, b, coeffs, n, resolved) in enumerate(pieces, start=1):
+        # Eigenvalues of the colleague matrix are the roots of the Chebyshev series
+        local = []
+        if len(coeffs) > 1:
+            for t in C.chebroots(coeffs):
+                if abs(t.imag) <= 1e-8 and -1 - 1e-8 <= t.real <= 1 + 1e-8:
+                    local.append((b - a) / 2 * min(max(t.real, -1.0), 1.0) + (a + b) / 2)
+        elif coeffs[0] == 0:
+            local.append((a + b) / 2)
+
+        # An unresolved piece (pole, jump) does not represent f, so its roots are not trusted
+        kept = 0
+        for r in (local if resolved else []):
+            r, count, converged = _polish(f, df, r, x_range[0], x_range[1], polish_steps)
+            evaluations += count
+            if not converged:
+                evaluations += 3
+                if not _small_residual(f, r, a, b):
+                    continue
+            kept += 1
+            if not any(abs(r - existing) < 1e-8 * max(1.0, abs(r)) for existing in roots):
+                roots.append(r)
+
+        rows.append([i, a, b, n, len(coeffs) - 1, np.max(np.abs(coeffs[-3:])), kept,
+                     'Resolved' if resolved else f'Not resolved at max depth: {len(local)} candidate(s) dropped'])
+
+    roots.sort()
+    return roots, rows, evaluations
+
+
+def chebyshev_ui(f, df, x_range):
+    tol = 1e-13
+    start = time.perf_counter()
+    roots, table, evaluations = chebyshev_roots(f, x_range, df, tol)
+    solve_time = time.perf_counter() - start
+
+    # 🧮 Chebyshev Summary
+    st.markdown(f"""
+        <div style='
+            border: 2px solid #ff00ff;
+            background-color: #12122a;
+            border-radius: 12px;
+            padding: 1.2rem;
+            box-shadow: 0 0 15px #00fff733;
+            margin-bottom: 1.5rem;
+        '>
+            <h4 style='margin: 0; color: #ff00ff;'>🧮 Chebyshev Proxy Summary</h4>
+            <p style='margin-top: 0.5rem; color: #00fff7;'>
+                Interval: <strong>[{x_range[0]}, {x_range[1]}]</strong> | Pieces: <strong>{len(table)}</strong> |
+                Function evaluations: <strong>{evaluations}</strong> | Tolerance: <strong>{tol}</strong>
+            </p>
+            <p style='margin-top: 0.5rem; color: #00fff7;'>
+                {f"{len(roots)} root(s) found: " + ', '.join(f'{r:.10f}' for r in roots) if roots else "No roots found."}
+            </p>
+        </div>
+    """, unsafe_allow_html=True)
+
+    # 📋 Piece Table
+    with st.expander("📋 Chebyshev Piece Table"):
+        piece_df = pd.DataFrame(table, columns=CHEBYSHEV_COLUMNS)
+        st.dataframe(piece_df.style.set_properties(**{
+            'color': '#00fff7',
+            'background-color': '#1a1a2e',
+            'border-color': '#ff00ff'
+        }))
+        trace_download_ui(lambda sink: sink.write_rows(table), CHEBYSHEV_COLUMNS, "chebyshev")
+
+    # 📈 Plot
+    X = np.linspace(*x_range, 1000)
+    Y = f(X)
+
+    with cyberpunk_plot("🔦 Function Plot with Detected Roots (Chebyshev Proxy)") as ax:
+        for row in table[1:]:
+            ax.axvline(row[1], color=MAGENTA, linestyle=':', linewidth=0.5, alpha=0.5)
+        plot_function_roots(ax, f, X, Y, roots)
+
+    return roots, {"iterations": len(table), "solve_time": solve_time, "evaluations": evaluations}
@@ -0,0 +1,148 @@
+import contextlib
+import csv
+import itertools
+import os
+import tempfile
+
+import numpy as np
+import streamlit as st
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+TRACE_DIR = os.environ.get("ROOT_FINDER_TRACE_DIR", os.path.join(os.path.expanduser("~"), ".root_finder", "traces"))
+
+
+# --- Chunked trace writer: CSV or Parquet row groups, constant memory ---
+class TraceWriter:
+    def __init__(self, path, columns, chunk_size=10000, fmt=None):
+        self.path = path
+        self.columns = list(columns)
+        self.chunk_size = chunk_size
+        self.fmt = fmt or ('parquet' if str(path).endswith('.parquet') else 'csv')
+        self.rows_written = 0
+        self._buffer = []
+        self._file = None
+        self._csv = None
+        self._parquet = None
+        self._schema = None
+
+        if self.fmt == 'parquet':
+            if pa is None:
+                raise ImportError("Parquet export requires pyarrow")
+        elif self.fmt == 'csv':
+            self._file = open(path, 'w', newline='', encoding='utf-8')
+            self._csv = csv.writer(self._file)
+            self._csv.writerow(self.columns)
+        else:
+            raise ValueError(f"unknown trace format '{self.fmt}'")
+
+    def write_rows(self, rows):
+        for row in rows:
+            self._buffer.append(row)
+            if len(self._buffer) >= self.chunk_size:
+                self.flush()
+
+    def write(self, row):
+        self.write_rows([row])
+
+    def flush(self):
+        if not self._buffer:
+            return
+        if self.fmt == 'csv':
+            self._csv.writerows([_plain(v) for v in row] for row in self._buffer)
+            self._file.flush()
+        else:
+            self._write_row_group()
+        self.rows_written += len(self._buffer)
+        self._buffer = []
+
+    def _write_row_group(self):
+        data = list(zip(*self._buffer))
+        if self._schema is None:
+            self._schema = pa.schema([(c, _arrow_type(values)) for c, values in zip(self.columns, data)])
+            self._parquet = pq.ParquetWriter(self.path, self._schema)
+        arrays = [
+            pa.array([_plain(v) for v in values], type=field.type, from_pandas=True)
+            for values, field in zip(data, self._schema)
+        ]
+        self._parquet.write_table(pa.Table.from_arrays(arrays, schema=self._schema))
+
+    def close(self):
+        self.flush()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if self._parquet is not None:
+            self._parquet.close()
+            self._parquet = None
+        elif self.fmt == 'parquet' and self._schema is None:
+            # No rows at all: still leave a readable, empty file behind
+            pq.write_table(pa.table({c: pa.array([], pa.string()) for c in self.columns}), self.path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _plain(value):
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def _arrow_type(values):
+    # The schema is fixed by the first row group, so every non-text column is stored as float64
+    present = [_plain(v) for v in values if v is not None]
+    if any(isinstance(v, str) for v in present):
+        return pa.string()
+    return pa.float64()
+
+
+def _trace_bytes(run, columns, name, fmt):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, f"{name}_trace.{fmt}")
+        with TraceWriter(path, columns, fmt=fmt) as writer:
+            run(writer)
+        with open(path, 'rb') as fh:
+            return fh.read()
+
+
+def trace_download_ui(run, columns, name):
+    # run(sink) re-runs the solver with its trace streamed into sink; this only happens
+    # when a download button is clicked, never as part of the page run itself
+    formats = ['csv'] + (['parquet'] if pa is not None else [])
+    cols = st.columns(len(formats))
+    for col, fmt in zip(cols, formats):
+        col.download_button(
+            f"💾 Download trace ({fmt.upper()})", data=lambda fmt=fmt: _trace_bytes(run, columns, name, fmt),
+            file_name=f"{name}_trace.{fmt}", mime='text/csv' if fmt == 'csv' else 'application/octet-stream',
+            key=f"{name}_download_{fmt}", on_click="ignore"
+        )
+
+
+# --- File output for batch runs, confined to TRACE_DIR ---
+def trace_sink(file_name, columns):
+    if not file_name:
+        return contextlib.nullcontext()
+    file_name = os.path.basename(file_name.strip())
+    if not file_name.endswith(('.csv', '.parquet')):
+        raise ValueError("trace file name must end in .csv or .parquet")
+    os.makedirs(TRACE_DIR, exist_ok=True)
+    # The directory is shared between runs: never overwrite, claim the first free "name-N.ext" instead
+    stem, ext = os.path.splitext(file_name)
+    for n in itertools.count():
+        path = os.path.join(TRACE_DIR, f"{stem}-{n}{ext}" if n else file_name)
+        try:
+            os.close(os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+            return TraceWriter(path, columns)
+        except FileExistsError:
+            continue
+
+
+def trace_output_ui(name):
+    return st.text_input(f"Stream trace to file in {TRACE_DIR} (.csv or .parquet, optional)",
+                         key=f"{name}_output_file").strip()
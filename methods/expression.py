@@ -0,0 +1,200 @@
+import ast
+import threading
+
+import sympy
+from sympy import Symbol, lambdify, diff, count_ops, cse
+from sympy.parsing.sympy_parser import parse_expr, standard_transformations, convert_xor
+
+ALLOWED_FUNCTIONS = {
+    'sin': sympy.sin, 'cos': sympy.cos, 'tan': sympy.tan,
+    'asin': sympy.asin, 'acos': sympy.acos, 'atan': sympy.atan,
+    'sinh': sympy.sinh, 'cosh': sympy.cosh, 'tanh': sympy.tanh,
+    'exp': sympy.exp, 'log': sympy.log, 'ln': sympy.log,
+    'sqrt': sympy.sqrt, 'abs': sympy.Abs, 'Abs': sympy.Abs,
+}
+ALLOWED_CONSTANTS = {'pi': sympy.pi, 'E': sympy.E}
+
+_ALLOWED_NODES = (
+    ast.Expression, ast.BinOp, ast.UnaryOp, ast.Call, ast.Name, ast.Constant, ast.Load,
+    ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Pow, ast.BitXor, ast.USub, ast.UAdd,
+)
+
+# --- Admission limits ---
+MAX_LENGTH = 500
+MAX_NODES = 300
+MAX_DEPTH = 40
+MAX_EXPONENT = 100
+MAX_POWER_NESTING = 3
+MAX_DIGITS = 30
+TIMEOUT = 2.0
+MAX_COST = 600
+MAX_RUNAWAY = 2
+
+_RUNAWAY = []
+
+
+def run_with_timeout(func, timeout, what):
+    # Python threads cannot be killed: a worker that times out keeps running until SymPy
+    # returns. The AST limits keep that work bounded, and at most MAX_RUNAWAY such workers
+    # may be alive at once, so repeated pathological input cannot pile up CPU load.
+    _RUNAWAY[:] = [w for w in _RUNAWAY if w.is_alive()]
+    if len(_RUNAWAY) >= MAX_RUNAWAY:
+        raise TimeoutError(f"{len(_RUNAWAY)} earlier expression(s) are still being processed, try again later")
+
+    result = {}
+
+    def target():
+        try:
+            result['value'] = func()
+        except Exception as e:
+            result['error'] = e
+
+    worker = threading.Thread(target=target, daemon=True)
+    worker.start()
+    worker.join(timeout)
+    if worker.is_alive():
+        _RUNAWAY.append(worker)
+        raise TimeoutError(f"{what} took longer than {timeout}s")
+    if 'error' in result:
+        raise result['error']
+    return result['value']
+
+
+def _constant_value(node):
+    # Folds variable-free arithmetic so that exponents such as 10**10**10 are
+    # measured before SymPy tries to build the integer.
+    if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)):
+        return float(node.value)
+    if isinstance(node, ast.Name) and node.id in ALLOWED_CONSTANTS:
+        return float(ALLOWED_CONSTANTS[node.id])
+    if isinstance(node, ast.UnaryOp):
+        value = _constant_value(node.operand)
+        if value is None:
+            return None
+        return -value if isinstance(node.op, ast.USub) else value
+    if isinstance(node, ast.BinOp):
+        left, right = _constant_value(node.left), _constant_value(node.right)
+        if left is None or right is None:
+            return None
+        try:
+            if isinstance(node.op, ast.Add):
+                return left + right
+            if isinstance(node.op, ast.Sub):
+                return left - right
+            if isinstance(node.op, ast.Mult):
+                return left * right
+            if isinstance(node.op, ast.Div):
+                return left / right if right != 0 else None
+            value = left ** right
+            return abs(value) if isinstance(value, complex) else value
+        except OverflowError:
+            return float('inf')
+        except ZeroDivisionError:
+            return None
+    return None
+
+
+def _family(op):
+    if isinstance(op, (ast.Add, ast.Sub)):
+        return 'sum'
+    if isinstance(op, (ast.Mult, ast.Div)):
+        return 'product'
+    return None
+
+
+def _check_syntax(text, variables):
+    if len(text) > MAX_LENGTH:
+        raise ValueError(f"expression is longer than {MAX_LENGTH} characters")
+    try:
+        tree = ast.parse(text.replace('^', '**'), mode='eval')
+    except SyntaxError as e:
+        raise ValueError(f"syntax error: {e.msg}") from None
+
+    allowed_names = set(variables) | set(ALLOWED_FUNCTIONS) | set(ALLOWED_CONSTANTS)
+    nodes = 0
+
+    def visit(node, depth, power_nesting):
+        nonlocal nodes
+        nodes += 1
+        if nodes > MAX_NODES:
+            raise ValueError(f"expression has more than {MAX_NODES} syntax nodes")
+        if depth > MAX_DEPTH:
+            raise ValueError(f"expression is nested deeper than {MAX_DEPTH} levels")
+        if not isinstance(node, _ALLOWED_NODES):
+            raise ValueError(f"'{type(node).__name__}' is not allowed in an expression")
+        if isinstance(node, (ast.BinOp, ast.UnaryOp)) and not isinstance(node.op, _ALLOWED_NODES):
+            raise ValueError(f"'{type(node.op).__name__}' is not allowed in an expression")
+
+        if isinstance(node, ast.Name) and node.id not in allowed_names:
+            raise ValueError(f"unknown name '{node.id}'")
+        if isinstance(node, ast.Constant):
+            if isinstance(node.value, bool) or not isinstance(node.value, (int, float)):
+                raise ValueError(f"constant {node.value!r} is not a number")
+            if len(str(abs(node.value))) > MAX_DIGITS:
+                raise ValueError(f"number literals are limited to {MAX_DIGITS} digits")
+        if isinstance(node, ast.Call):
+            if not isinstance(node.func, ast.Name) or node.func.id not in ALLOWED_FUNCTIONS:
+                raise ValueError("only the functions " + ', '.join(sorted(ALLOWED_FUNCTIONS)) + " may be called")
+            if node.keywords or len(node.args) != 1:
+                raise ValueError(f"{node.func.id}() takes exactly one argument")
+            visit(node.args[0], depth + 1, power_nesting)
+            return
+        if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Pow):
+            if power_nesting + 1 > MAX_POWER_NESTING:
+                raise ValueError(f"powers may be nested at most {MAX_POWER_NESTING} levels deep")
+            exponent = _constant_value(node.right)
+            if exponent is not None and abs(exponent) > MAX_EXPONENT:
+                raise ValueError(f"exponents are limited to ±{MAX_EXPONENT}")
+            visit(node.left, depth + 1, power_nesting + 1)
+            visit(node.right, depth + 1, power_nesting + 1)
+            return
+
+        if isinstance(node, ast.BinOp):
+            # a + b + c parses as ((a + b) + c): a chain of the same kind of operator is flat, not nested
+            chained = isinstance(node.left, ast.BinOp) and _family(node.left.op) == _family(node.op)
+            visit(node.left, depth if chained else depth + 1, power_nesting)
+            visit(node.right, depth + 1, power_nesting)
+            return
+
+        for child in ast.iter_child_nodes(node):
+            if not isinstance(child, (ast.operator, ast.unaryop)):
+                visit(child, depth + 1, power_nesting)
+
+    visit(tree, 0, 0)
+
+
+def expression_cost(exprs):
+    replacements, reduced = cse(exprs)
+    return sum(count_ops(e) for _, e in replacements) + sum(count_ops(e) for e in reduced)
+
+
+def parse_expression(text, variables=('x',), timeout=TIMEOUT):
+    text = text.strip()
+    if not text:
+        raise ValueError("expression is empty")
+    _check_syntax(text, variables)
+
+    local_dict = {v: Symbol(v, real=True) for v in variables}
+    global_dict = {'Integer': sympy.Integer, 'Float': sympy.Float, 'Rational': sympy.Rational, 'Symbol': Symbol}
+    global_dict.update(ALLOWED_FUNCTIONS)
+    global_dict.update(ALLOWED_CONSTANTS)
+
+    return run_with_timeout(
+        lambda: parse_expr(text, local_dict=local_dict, global_dict=global_dict,
+                           transformations=standard_transformations + (convert_xor,)),
+        timeout, "parsing"
+    )
+
+
+def compile_expression(text, variables=('x',), timeout=TIMEOUT, max_cost=MAX_COST):
+    symbols_ = [Symbol(v, real=True) for v in variables]
+    f_expr = parse_expression(text, variables, timeout)
+    df_expr = run_with_timeout(lambda: diff(f_expr, symbols_[0]), timeout, "differentiation")
+
+    cost = run_with_timeout(lambda: expression_cost([f_expr, df_expr]), timeout, "cost estimation")
+    if cost > max_cost:
+        raise ValueError(f"f and f′ need {cost} operations per evaluation (budget is {max_cost})")
+
+    f = lambdify(symbols_, f_expr, modules='numpy', cse=True)
+    df = lambdify(symbols_, df_expr, modules='numpy', cse=True)
+    return f, df, f_expr, df_expr
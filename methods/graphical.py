@@ -1,10 +1,12 @@
+import time
 import numpy as np
 import streamlit as st
 import pandas as pd
-import matplotlib.pyplot as plt
-import matplotlib.cm as cm
 import seaborn as sns
 
+from methods.export import trace_download_ui
+from methods.plotting import cyberpunk_plot, plot_function_roots
+
 def find_graphical_roots(f, x_range, resolution=1000, tol=1e-6):
     X = np.linspace(*x_range, resolution)
     Y = f(X)
@@ -25,7 +27,10 @@ def find_graphical_roots(f, x_range, resolution=1000, tol=1e-6):
 def graphical_ui(f, x_range):
     resolution = 1000
     tol = 1e-6
+    start = time.perf_counter()
     roots, X, Y, table_data = find_graphical_roots(f, x_range, resolution, tol)
+    solve_time = time.perf_counter() - start
+    evaluations = f.points
 
     # --- Cyberpunk Root Info Card ---
     st.markdown(f"""
@@ -48,26 +53,9 @@ def graphical_ui(f, x_range):
             'color': '#00fff7',
             'border-color': '#ff00ff'
         }))
+        trace_download_ui(lambda sink: sink.write_rows(np.column_stack((X, Y))), ["x", "f(x)"], "graphical")
 
     # --- Cyberpunk Plot ---
-    fig, ax = plt.subplots(figsize=(8, 5))
-    fig.patch.set_facecolor('#12122a')
-    ax.set_facecolor('#12122a')
-
-    ax.plot(X, Y, label="f(x)", color="#00fff7", linewidth=2)
-    ax.axhline(0, color='#ff00ff', linestyle='--', linewidth=1)
-
-    cmap = cm.get_cmap('cool', len(roots))
-    for i, root in enumerate(roots):
-        color = cmap(i)
-        ax.plot(root, f(root), 'o', color=color, label=f'Root {i+1}: {root:.4f}')
-        ax.annotate(f'{root:.4f}', (root, f(root)), textcoords="offset points", xytext=(0,10), ha='center', fontsize=9, color=color)
-
-    ax.set_title("Function Plot with Detected Roots (Graphical)", fontsize=14, weight='bold', color='magenta')
-    ax.set_xlabel("x", fontsize=12, color='#00fff7')
-    ax.set_ylabel("f(x)", fontsize=12, color='#00fff7')
-    ax.tick_params(colors='#00fff7')
-    ax.legend(frameon=False, labelcolor='#ff00ff')
-
-    st.pyplot(fig)
-    return roots
+    with cyberpunk_plot("Function Plot with Detected Roots (Graphical)") as ax:
+        plot_function_roots(ax, f, X, Y, roots, cmap='cool', digits=4)
+    return roots, {"iterations": len(X), "solve_time": solve_time, "evaluations": evaluations}
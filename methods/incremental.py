@@ -1,13 +1,18 @@
+import time
 import numpy as np
 import pandas as pd
 import streamlit as st
-import matplotlib.pyplot as plt
-import matplotlib.cm as cm
 
-def incremental_search(f, x_range, dx=0.001):
+from methods.export import trace_download_ui
+from methods.plotting import cyberpunk_plot, plot_function_roots
+
+INCREMENTAL_COLUMNS = ["Iteration", "Xl", "ΔX", "Xu", "f(Xl)", "f(Xu)", "f(Xl) * f(Xu)", "Remark"]
+
+def incremental_search(f, x_range, dx=0.001, sink=None):
     a, b = x_range
     roots = []
     rows = []
+    emit = sink.write if sink is not None else rows.append
     iteration = 1
 
     while a < b:
@@ -22,7 +27,7 @@ def incremental_search(f, x_range, dx=0.001):
                 roots.append(root)
                 remark = 'Root detected'
 
-        rows.append([iteration, a, delta_x, a + dx, fa, fb, fa * fb, remark])
+        emit([iteration, a, delta_x, a + dx, fa, fb, fa * fb, remark])
         a += dx
         iteration += 1
 
@@ -30,7 +35,10 @@ def incremental_search(f, x_range, dx=0.001):
 
 def incremental_ui(f, x_range):
     dx = 0.001
+    start = time.perf_counter()
     roots, table = incremental_search(f, x_range, dx)
+    solve_time = time.perf_counter() - start
+    evaluations = f.points
 
     # Cyberpunk Root Summary
     st.markdown(
@@ -58,38 +66,19 @@ def incremental_ui(f, x_range):
 
     # Highlighted Iteration Table
     with st.expander("📋 Detailed Table (Incremental Search Steps)"):
-        df = pd.DataFrame(
-            table,
-            columns=["Iteration", "Xl", "ΔX", "Xu", "f(Xl)", "f(Xu)", "f(Xl) * f(Xu)", "Remark"]
-        )
+        df = pd.DataFrame(table, columns=INCREMENTAL_COLUMNS)
 
         def highlight_roots(row):
             return ['background-color: #1a1a2e; color: #00fff7;'] * len(row) if row["Remark"] == "Root detected" else [''] * len(row)
 
         st.dataframe(df.style.apply(highlight_roots, axis=1))
+        trace_download_ui(lambda sink: incremental_search(f, x_range, dx, sink=sink), INCREMENTAL_COLUMNS, "incremental")
 
     # Cyberpunk Function Plot
     X = np.linspace(*x_range, 1000)
     Y = f(X)
 
-    plt.style.use("dark_background")
-    fig, ax = plt.subplots(figsize=(8, 5))
-    ax.plot(X, Y, label="f(x)", color="#00fff7", linewidth=2)
-    ax.axhline(0, color='#ff00ff', linestyle='--', linewidth=1)
-
-    cmap = cm.get_cmap('plasma', len(roots))
-    for i, root in enumerate(roots):
-        color = cmap(i)
-        ax.plot(root, f(root), 'o', color=color, label=f'Root {i+1}: {root:.4f}')
-        ax.annotate(f'{root:.4f}', (root, f(root)), textcoords="offset points", xytext=(0, 10),
-                    ha='center', fontsize=9, color=color)
-
-    ax.set_xlabel("x", fontsize=12, color="#ff00ff")
-    ax.set_ylabel("f(x)", fontsize=12, color="#ff00ff")
-    ax.set_title("🔦 Function Plot with Detected Roots (Incremental Search)", fontsize=14, color="#ff00ff", weight='bold')
-    ax.tick_params(axis='x', colors='#00fff7')
-    ax.tick_params(axis='y', colors='#00fff7')
-    ax.legend(frameon=False)
-    st.pyplot(fig)
+    with cyberpunk_plot("🔦 Function Plot with Detected Roots (Incremental Search)") as ax:
+        plot_function_roots(ax, f, X, Y, roots, digits=4)
 
-    return roots
+    return roots, {"iterations": len(table), "solve_time": solve_time, "evaluations": evaluations}
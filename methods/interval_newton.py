@@ -0,0 +1,373 @@
+import time
+import math
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+from sympy import Symbol, lambdify
+from sympy.printing.str import StrPrinter
+
+from methods.export import trace_download_ui
+from methods.plotting import cyberpunk_plot, plot_function_roots, MAGENTA
+from methods.telemetry import CountingFunction
+
+INTERVAL_NEWTON_COLUMNS = ["Step", "X lower", "X upper", "F(X) lower", "F(X) upper", "Remark"]
+
+
+# --- Outward-rounded interval arithmetic ---
+def _down(v):
+    return math.nextafter(v, -math.inf)
+
+
+def _up(v):
+    return math.nextafter(v, math.inf)
+
+
+class Interval:
+    __slots__ = ('lo', 'hi')
+
+    def __init__(self, lo, hi=None):
+        self.lo = float(lo)
+        self.hi = float(lo if hi is None else hi)
+
+    @staticmethod
+    def _coerce(other):
+        return other if isinstance(other, Interval) else Interval(other)
+
+    @property
+    def mid(self):
+        return self.lo + (self.hi - self.lo) / 2
+
+    @property
+    def width(self):
+        return self.hi - self.lo
+
+    def contains(self, value):
+        return self.lo <= value <= self.hi
+
+    def __add__(self, other):
+        other = self._coerce(other)
+        return Interval(_down(self.lo + other.lo), _up(self.hi + other.hi))
+
+    __radd__ = __add__
+
+    def __neg__(self):
+        return Interval(-self.hi, -self.lo)
+
+    def __pos__(self):
+        return self
+
+    def __sub__(self, other):
+        return self + (-self._coerce(other))
+
+    def __rsub__(self, other):
+        return self._coerce(other) - self
+
+    def __mul__(self, other):
+        other = self._coerce(other)
+        products = [a * b for a in (self.lo, self.hi) for b in (other.lo, other.hi)]
+        products = [0.0 if math.isnan(p) else p for p in products]
+        return Interval(_down(min(products)), _up(max(products)))
+
+    __rmul__ = __mul__
+
+    def reciprocal(self):
+        if self.lo <= 0 <= self.hi:
+            return Interval(-math.inf, math.inf)
+        return Interval(_down(1 / self.hi), _up(1 / self.lo))
+
+    def __truediv__(self, other):
+        return self * self._coerce(other).reciprocal()
+
+    def __rtruediv__(self, other):
+        return self._coerce(other) * self.reciprocal()
+
+    def __pow__(self, exponent):
+        if isinstance(exponent, Interval):
+            if exponent.width != 0:
+                return _exp(exponent * _log(self))
+            exponent = exponent.lo
+        if float(exponent).is_integer():
+            n = int(exponent)
+            if n == 0:
+                return Interval(1.0)
+            if n < 0:
+                return (self ** -n).reciprocal()
+            lo, hi = self.lo ** n, self.hi ** n
+            if n % 2 == 0:
+                if self.lo <= 0 <= self.hi:
+                    return Interval(0.0, _up(max(lo, hi)))
+                return Interval(_down(min(lo, hi)), _up(max(lo, hi)))
+            return Interval(_down(lo), _up(hi))
+        return _exp(_log(self) * exponent)
+
+    def __rpow__(self, base):
+        return _exp(self * _log(self._coerce(base)))
+
+    def __repr__(self):
+        return f"[{self.lo:.10g}, {self.hi:.10g}]"
+
+
+def _monotone(func, increasing=True):
+    def apply(x):
+        x = Interval._coerce(x)
+        lo, hi = (func(x.lo), func(x.hi)) if increasing else (func(x.hi), func(x.lo))
+        return Interval(_down(lo), _up(hi))
+    return apply
+
+
+def _safe(func, value, default):
+    try:
+        return func(value)
+    except (OverflowError, ValueError):
+        return default
+
+
+def _exp(x):
+    x = Interval._coerce(x)
+    return Interval(max(0.0, _down(_safe(math.exp, x.lo, 0.0))), _up(_safe(math.exp, x.hi, math.inf)))
+
+
+def _log(x):
+    x = Interval._coerce(x)
+    if x.hi <= 0:
+        raise ValueError("log of a non-positive interval")
+    lo = _down(math.log(x.lo)) if x.lo > 0 else -math.inf
+    return Interval(lo, _up(math.log(x.hi)))
+
+
+def _sqrt(x):
+    x = Interval._coerce(x)
+    if x.hi < 0:
+        raise ValueError("sqrt of a negative interval")
+    return Interval(max(0.0, _down(math.sqrt(max(x.lo, 0.0)))), _up(math.sqrt(x.hi)))
+
+
+def _abs(x):
+    x = Interval._coerce(x)
+    if x.lo >= 0:
+        return x
+    if x.hi <= 0:
+        return -x
+    return Interval(0.0, max(-x.lo, x.hi))
+
+
+def _sign(x):
+    x = Interval._coerce(x)
+    return Interval(float(np.sign(x.lo)), float(np.sign(x.hi)))
+
+
+def _periodic(func, shift):
+    # sin(x) = cos(x - π/2): extrema of cos sit at multiples of π
+    def apply(x):
+        x = Interval._coerce(x) - shift
+        if x.width >= 2 * math.pi:
+            return Interval(-1.0, 1.0)
+        values = [func(x.lo), func(x.hi)]
+        k = math.ceil(x.lo / math.pi)
+        while k * math.pi <= x.hi:
+            values.append(1.0 if k % 2 == 0 else -1.0)
+            k += 1
+        return Interval(max(-1.0, _down(min(values))), min(1.0, _up(max(values))))
+    return apply
+
+
+def _tan(x):
+    x = Interval._coerce(x)
+    k = math.ceil((x.lo - math.pi / 2) / math.pi)
+    if k * math.pi + math.pi / 2 <= x.hi:
+        return Interval(-math.inf, math.inf)
+    return Interval(_down(math.tan(x.lo)), _up(math.tan(x.hi)))
+
+
+def _cosh(x):
+    x = Interval._coerce(x)
+    lo = 1.0 if x.contains(0.0) else _down(min(_safe(math.cosh, x.lo, math.inf), _safe(math.cosh, x.hi, math.inf)))
+    return Interval(lo, _up(max(_safe(math.cosh, x.lo, math.inf), _safe(math.cosh, x.hi, math.inf))))
+
+
+def _clamped(func, lo, hi):
+    def apply(x):
+        x = Interval._coerce(x)
+        if x.hi < lo or x.lo > hi:
+            raise ValueError(f"{func.__name__} outside its domain")
+        return _monotone(func)(Interval(max(x.lo, lo), min(x.hi, hi)))
+    return apply
+
+
+INTERVAL_MODULE = {
+    'sin': _periodic(math.cos, math.pi / 2), 'cos': _periodic(math.cos, 0.0), 'tan': _tan,
+    'asin': _clamped(math.asin, -1.0, 1.0), 'acos': lambda x: math.pi / 2 - _clamped(math.asin, -1.0, 1.0)(x),
+    'atan': _monotone(math.atan),
+    'sinh': _monotone(lambda v: _safe(math.sinh, v, math.copysign(math.inf, v))), 'cosh': _cosh,
+    'tanh': _monotone(math.tanh),
+    'exp': _exp, 'log': _log, 'sqrt': _sqrt, 'Abs': _abs, 'sign': _sign,
+    'pi': Interval(_down(math.pi), _up(math.pi)), 'E': Interval(_down(math.e), _up(math.e)),
+    'e': Interval(_down(math.e), _up(math.e)),
+}
+
+
+def interval_function(expr, variable='x'):
+    # StrPrinter keeps exp(), sign(), Abs() etc. as plain calls, resolved against INTERVAL_MODULE.
+    # Constants such as 1/3 are printed as plain floats; they are widened by the arithmetic around them
+    return lambdify(Symbol(variable, real=True), expr, modules=[INTERVAL_MODULE, 'math'], printer=StrPrinter)
+
+
+def _evaluate(F, X):
+    # Anything that cannot be bounded (domain errors, unsupported functions) bounds nothing
+    try:
+        value = F(X)
+    except (ValueError, ZeroDivisionError, OverflowError, TypeError, NameError):
+        return Interval(-math.inf, math.inf)
+    value = Interval._coerce(value)
+    if math.isnan(value.lo) or math.isnan(value.hi):
+        return Interval(-math.inf, math.inf)
+    return value
+
+
+# --- Interval Newton with bisection ---
+SPLIT = 0.4990234375
+PAD = 1e-6
+
+
+def interval_newton_roots(F, dF, x_range, tol=1e-10, max_iter=10000, sink=None):
+    # Pad the search box so that a simple root sitting exactly on an endpoint is interior,
+    # which the Newton existence test needs; results are restricted to x_range at the end
+    a, b = x_range
+    pad = PAD * max(1.0, b - a)
+    stack = [Interval(a - pad, b + pad)]
+    certified = []
+    unresolved = []
+    rows = []
+    emit = sink.write if sink is not None else rows.append
+    iteration = 0
+
+    while stack and iteration < max_iter:
+        X = stack.pop()
+        iteration += 1
+        FX = _evaluate(F, X)
+
+        if not FX.contains(0.0):
+            emit([iteration, X.lo, X.hi, FX.lo, FX.hi, 'Pruned: 0 ∉ F(X)'])
+            continue
+
+        # The Newton test assumes f is continuous on X; an unbounded F(X) (a pole, as in tan or 1/x) rules that out
+        bounded = math.isfinite(FX.lo) and math.isfinite(FX.hi)
+        dFX = _evaluate(dF, X)
+        if bounded and not dFX.contains(0.0):
+            # f is strictly monotone on X: N(X) = m - F(m)/F'(X)
+            m = X.mid
+            N = Interval(m) - _evaluate(F, Interval(m)) / dFX
+            lo, hi = max(X.lo, N.lo), min(X.hi, N.hi)
+            if lo > hi:
+                emit([iteration, X.lo, X.hi, FX.lo, FX.hi, 'Pruned: N(X) ∩ X = ∅'])
+                continue
+            if X.lo < N.lo and N.hi < X.hi:
+                if N.width <= tol * max(1.0, abs(m)):
+                    certified.append(Interval(lo, hi))
+                    emit([iteration, lo, hi, FX.lo, FX.hi, 'Unique root certified'])
+                else:
+                    stack.append(Interval(lo, hi))
+                    emit([iteration, lo, hi, FX.lo, FX.hi, 'Newton contraction'])
+                continue
+            if hi - lo < X.width * 0.75:
+                stack.append(Interval(lo, hi))
+                emit([iteration, lo, hi, FX.lo, FX.hi, 'Newton contraction'])
+                continue
+
+        if X.width <= tol * max(1.0, abs(X.mid)):
+            unresolved.append(X)
+            emit([iteration, X.lo, X.hi, FX.lo, FX.hi,
+                  'Unresolved: possible multiple root' if bounded else 'Unresolved: f unbounded (pole?)'])
+            continue
+
+        # Split slightly off-centre so that roots at "round" numbers do not land on a box edge
+        m = X.lo + X.width * SPLIT
+        stack.append(Interval(m, X.hi))
+        stack.append(Interval(X.lo, m))
+        emit([iteration, X.lo, X.hi, FX.lo, FX.hi, 'Bisected'])
+
+    unresolved.extend(stack)
+    certified = sorted((X for X in certified if X.hi >= a and X.lo <= b), key=lambda X: X.lo)
+    unresolved = [Interval(max(X.lo, a), min(X.hi, b)) for X in _merge(unresolved) if X.hi >= a and X.lo <= b]
+    return certified, unresolved, rows
+
+
+def _merge(intervals):
+    merged = []
+    for X in sorted(intervals, key=lambda X: X.lo):
+        if merged and X.lo <= merged[-1].hi:
+            merged[-1] = Interval(merged[-1].lo, max(merged[-1].hi, X.hi))
+        else:
+            merged.append(X)
+    return merged
+
+
+def interval_newton_ui(f, f_expr, df_expr, x_range):
+    tol = 1e-10
+    # Interval evaluations of F and dF do the solving; f itself is only sampled for the plot
+    F = CountingFunction(interval_function(f_expr))
+    dF = CountingFunction(interval_function(df_expr))
+
+    start = time.perf_counter()
+    enclosures, unresolved, table = interval_newton_roots(F, dF, x_range, tol)
+    solve_time = time.perf_counter() - start
+    evaluations = F.calls + dF.calls
+    roots = [X.mid for X in enclosures]
+
+    # 🛡️ Verified Enclosure Summary
+    st.markdown(f"""
+        <div style='
+            border: 2px solid #ff00ff;
+            background-color: #12122a;
+            border-radius: 12px;
+            padding: 1.2rem;
+            box-shadow: 0 0 15px #00fff733;
+            margin-bottom: 1.5rem;
+        '>
+            <h4 style='margin: 0; color: #ff00ff;'>🛡️ Verified Enclosure Summary</h4>
+            <p style='margin-top: 0.5rem; color: #00fff7;'>
+                Interval: <strong>[{x_range[0]}, {x_range[1]}]</strong> | Tolerance: <strong>{tol}</strong> |
+                Boxes examined: <strong>{len(table)}</strong> | Interval evaluations: <strong>{evaluations}</strong>
+            </p>
+            <p style='margin-top: 0.5rem; color: #00fff7;'>
+                {f"{len(roots)} certified root(s): " + ', '.join(f'{r:.10f}' for r in roots) if roots else "No certified roots."}
+                {f"<br>{len(unresolved)} unresolved region(s) may hold multiple roots or poles: " + ', '.join(repr(X) for X in unresolved) if unresolved else ""}
+            </p>
+        </div>
+    """, unsafe_allow_html=True)
+
+    # 📌 Enclosure Table
+    if enclosures or unresolved:
+        enclosure_df = pd.DataFrame(
+            [[X.lo, X.hi, X.width, "Certified: exactly one root"] for X in enclosures] +
+            [[X.lo, X.hi, X.width, "Unresolved"] for X in unresolved],
+            columns=["Lower", "Upper", "Width", "Status"]
+        )
+        st.dataframe(enclosure_df.style.set_properties(**{
+            'color': '#00fff7',
+            'background-color': '#1a1a2e',
+            'border-color': '#ff00ff'
+        }))
+
+    # 📋 Box Table
+    with st.expander("📋 Interval Newton Box Table"):
+        box_df = pd.DataFrame(table, columns=INTERVAL_NEWTON_COLUMNS)
+        st.dataframe(box_df.style.set_properties(**{
+            'color': '#00fff7',
+            'background-color': '#1a1a2e',
+            'border-color': '#ff00ff'
+        }))
+        trace_download_ui(lambda sink: interval_newton_roots(F, dF, x_range, tol, sink=sink), INTERVAL_NEWTON_COLUMNS,
+                          "interval_newton")
+
+    # 📈 Plot
+    X = np.linspace(*x_range, 500)
+    Y = f(X)
+
+    with cyberpunk_plot("🔦 Function Plot with Certified Roots (Interval Newton)") as ax:
+        for region in unresolved:
+            ax.axvspan(region.lo, region.hi, color=MAGENTA, alpha=0.3)
+        plot_function_roots(ax, f, X, Y, roots)
+
+    return roots, {"iterations": len(table), "solve_time": solve_time, "evaluations": evaluations}
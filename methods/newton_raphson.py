@@ -1,9 +1,16 @@
+import time
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
-import matplotlib.cm as cm
 import streamlit as st
 
+from methods.export import trace_download_ui
+from methods.plotting import cyberpunk_plot, plot_function_roots
+from methods.seeding import scan_seeds, LaunchGuard, new_report, record_launch, report_summary, LAUNCH_COLUMNS
+
+NEWTON_RAPHSON_COLUMNS = [
+    "Initial Guess", "Iteration", "x₀", "f(x₀)", "f′(x₀)", "x₁", "Approx. Rel. Error (%)"
+]
+
 def newton_raphson_method(f, df, x0, tol=1e-5, max_iter=100):
     rows = []
     for i in range(1, max_iter + 1):
@@ -19,26 +26,83 @@ def newton_raphson_method(f, df, x0, tol=1e-5, max_iter=100):
         x0 = x1
     return (x1 if rows else None), rows
 
-def newton_raphson_all_roots(f, df, x0_range, step=0.5, tol=1e-5, max_iter=100):
+def newton_raphson_all_roots(f, df, x0_range, step=0.5, tol=1e-5, max_iter=100, sink=None):
     x0_start, x0_end = x0_range
     roots = []
     all_rows = []
+    emit = sink.write_rows if sink is not None else all_rows.extend
 
     for x0 in np.arange(x0_start, x0_end + 1e-9, step):
         root, rows = newton_raphson_method(f, df, x0, tol, max_iter)
-        for r in rows:
-            all_rows.append([x0] + r)
+        emit([x0] + r for r in rows)
         if root is not None and not any(abs(root - r0) < tol for r0 in roots):
             roots.append(root)
 
     return roots, all_rows
 
+# --- Guarded launch: stops as soon as the iterate leaves, cycles or repeats a known root ---
+def newton_raphson_guarded(f, df, x0, guard, tol=1e-5, max_iter=100, bracket=None):
+    rows = []
+    if bracket is not None:
+        lo, hi = bracket
+        flo = f(lo)
+        scale = max(abs(flo), abs(f(hi)))
+    for i in range(1, max_iter + 1):
+        fx = f(x0)
+        if fx == 0:
+            return x0, rows, 'Converged'
+        if bracket is not None:
+            # lo and hi straddle a sign change: keep the bracket tight around it
+            if (fx > 0) == (flo > 0):
+                lo, flo = x0, fx
+            else:
+                hi = x0
+        dfx = df(x0)
+        if dfx == 0 and bracket is None:
+            return None, rows, 'Zero derivative'
+        x1 = x0 - fx / dfx if dfx != 0 else np.nan
+        if bracket is not None and not min(lo, hi) < x1 < max(lo, hi):
+            # Newton step left the bracket (or f' vanished): bisect it instead
+            x1 = (lo + hi) / 2
+        ea = abs((x1 - x0) / x1) * 100 if x1 != 0 else None
+        rows.append([i, x0, fx, dfx, x1, ea])
+        if ea is not None and ea < tol:
+            if bracket is not None and abs(fx) > 1e-3 * scale:
+                # The bracket closed in on a point where |f| grew: a pole (tan, 1/x), not a root
+                return None, rows, 'Pole (sign change without root)'
+            return x1, rows, 'Converged'
+        status = guard.check(x1, fx)
+        if status:
+            return None, rows, status
+        x0 = x1
+    return None, rows, 'Max iterations'
+
+def newton_raphson_seeded_roots(f, df, x0_range, step=0.5, tol=1e-5, max_iter=100, sink=None):
+    roots = []
+    all_rows = []
+    emit = sink.write_rows if sink is not None else all_rows.extend
+    report = new_report(len(np.arange(x0_range[0], x0_range[1] + 1e-9, step)), max_iter)
+
+    for x0, lo, hi, kind in scan_seeds(f, x0_range, step, df):
+        bracket = (lo, hi) if kind == 'Sign change' else None
+        guard = LaunchGuard(x0_range, roots, bracket=bracket)
+        root, rows, status = newton_raphson_guarded(f, df, x0, guard, tol, max_iter, bracket)
+        emit([x0] + r for r in rows)
+        record_launch(report, x0, kind, status, len(rows), root)
+        if root is not None and not any(abs(root - r0) < tol for r0 in roots):
+            roots.append(root)
+
+    return roots, all_rows, report
+
 def newton_raphson_ui(f, df, x_range):
     step = 0.5
     tol = 1e-5
     max_iter = 100
 
-    roots, table = newton_raphson_all_roots(f, df, x_range, step, tol, max_iter)
+    start = time.perf_counter()
+    roots, table, report = newton_raphson_seeded_roots(f, df, x_range, step, tol, max_iter)
+    solve_time = time.perf_counter() - start
+    evaluations = f.points + df.points
 
     # ✨ Cyberpunk Root Summary
     st.markdown(f"""
@@ -58,43 +122,36 @@ def newton_raphson_ui(f, df, x_range):
             <p style='font-size: 1.05rem; color: #00fff7;'>
                 {f"{len(roots)} root(s) found: " + ', '.join(f'{r:.5f}' for r in roots) if roots else "No roots found."}
             </p>
+            <p style='margin-top: 0.5rem; color: #00fff7;'>
+                🚀 {report_summary(report)}
+            </p>
         </div>
     """, unsafe_allow_html=True)
 
+    # 🚀 Launch Log
+    with st.expander("🚀 Newton–Raphson Launch Log"):
+        st.dataframe(pd.DataFrame(report['log'], columns=LAUNCH_COLUMNS).style.set_properties(**{
+            'color': '#00fff7',
+            'background-color': '#1a1a2e',
+            'border-color': '#ff00ff'
+        }))
+
     # 📋 Iteration Table
     with st.expander("📋 Newton–Raphson Iteration Table"):
-        iter_df = pd.DataFrame(table, columns=[
-            "Initial Guess", "Iteration", "x₀", "f(x₀)", "f′(x₀)", "x₁", "Approx. Rel. Error (%)"
-        ])
+        iter_df = pd.DataFrame(table, columns=NEWTON_RAPHSON_COLUMNS)
         st.dataframe(iter_df.style.set_properties(**{
             'color': '#00fff7',
             'background-color': '#1a1a2e',
             'border-color': '#ff00ff'
         }))
+        trace_download_ui(lambda sink: newton_raphson_seeded_roots(f, df, x_range, step, tol, max_iter, sink=sink),
+                          NEWTON_RAPHSON_COLUMNS, "newton_raphson")
 
     # 📈 Cyberpunk Plot
     X = np.linspace(*x_range, 500)
     Y = f(X)
 
-    plt.style.use("dark_background")
-    fig, ax = plt.subplots(figsize=(8, 5))
-    ax.plot(X, Y, label="f(x)", color="#00fff7", linewidth=2)
-    ax.axhline(0, color='#ff00ff', linestyle='--', linewidth=1)
-
-    cmap = cm.get_cmap('plasma', len(roots))
-    for i, root in enumerate(roots):
-        color = cmap(i)
-        ax.plot(root, f(root), 'o', color=color, label=f'Root {i+1}: {root:.5f}')
-        ax.annotate(f'{root:.5f}', (root, f(root)),
-                    textcoords="offset points", xytext=(0, 10),
-                    ha='center', fontsize=9, color=color)
-
-    ax.set_xlabel("x", fontsize=12, color="#ff00ff")
-    ax.set_ylabel("f(x)", fontsize=12, color="#ff00ff")
-    ax.set_title("🔦 Function Plot with Detected Roots (Newton–Raphson)", fontsize=14, color="#ff00ff", weight='bold')
-    ax.tick_params(axis='x', colors='#00fff7')
-    ax.tick_params(axis='y', colors='#00fff7')
-    ax.legend(frameon=False)
-    st.pyplot(fig)
-
-    return roots
+    with cyberpunk_plot("🔦 Function Plot with Detected Roots (Newton–Raphson)") as ax:
+        plot_function_roots(ax, f, X, Y, roots)
+
+    return roots, {"iterations": len(table), "solve_time": solve_time, "evaluations": evaluations}
@@ -0,0 +1,100 @@
+import io
+import queue
+from contextlib import contextmanager
+
+import matplotlib
+import streamlit as st
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure, SubplotParams
+
+# --- Cyberpunk theme (same palette as the CSS in main.py), applied per figure ---
+BACKGROUND = '#12122a'
+CYAN = '#00fff7'
+MAGENTA = '#ff00ff'
+
+FIGSIZE = (8, 5)
+DPI = 100
+RENDER_DPI = 200
+POOL_SIZE = 4
+MARGINS = dict(left=0.09, right=0.97, bottom=0.11, top=0.91)
+
+
+# --- Figure pool: plain Figure objects, never registered with pyplot ---
+class FigurePool:
+    def __init__(self, size=POOL_SIZE, figsize=FIGSIZE, dpi=DPI):
+        self.figsize = figsize
+        self.dpi = dpi
+        self.created = 0
+        self._free = queue.LifoQueue(maxsize=size)
+
+    def acquire(self, figsize=None):
+        try:
+            fig = self._free.get_nowait()
+        except queue.Empty:
+            # Fixed margins instead of a layout engine: one draw per render, same geometry every time
+            fig = Figure(figsize=self.figsize, dpi=self.dpi, subplotpars=SubplotParams(**MARGINS))
+            FigureCanvasAgg(fig)
+            self.created += 1
+        fig.set_size_inches(figsize or self.figsize)
+        return fig
+
+    def release(self, fig):
+        fig.clear()
+        try:
+            self._free.put_nowait(fig)
+        except queue.Full:
+            # Pool is full (many concurrent sessions): drop it, nothing else holds a reference
+            pass
+
+    def __len__(self):
+        return self._free.qsize()
+
+
+FIGURES = FigurePool()
+
+
+def palette(n, name='plasma'):
+    cmap = matplotlib.colormaps[name].resampled(max(n, 1))
+    return [cmap(i) for i in range(n)]
+
+
+def _style(fig, ax, title, xlabel, ylabel):
+    fig.patch.set_facecolor(BACKGROUND)
+    ax.set_facecolor(BACKGROUND)
+    for spine in ax.spines.values():
+        spine.set_color(CYAN)
+    ax.set_xlabel(xlabel, fontsize=12, color=MAGENTA)
+    ax.set_ylabel(ylabel, fontsize=12, color=MAGENTA)
+    ax.set_title(title, fontsize=14, color=MAGENTA, weight='bold')
+    ax.tick_params(colors=CYAN)
+
+
+def render_png(fig):
+    # Fixed canvas: no tight bbox, so every plot is the same pixel size
+    buf = io.BytesIO()
+    fig.savefig(buf, format='png', dpi=RENDER_DPI, facecolor=fig.get_facecolor())
+    return buf.getvalue()
+
+
+@contextmanager
+def cyberpunk_plot(title, xlabel="x", ylabel="f(x)", figsize=None, legend=True):
+    fig = FIGURES.acquire(figsize)
+    try:
+        ax = fig.add_subplot()
+        _style(fig, ax, title, xlabel, ylabel)
+        yield ax
+        if legend and ax.get_legend_handles_labels()[0]:
+            ax.legend(frameon=False, labelcolor=MAGENTA)
+        st.image(render_png(fig), width='stretch')
+    finally:
+        FIGURES.release(fig)
+
+
+def plot_function_roots(ax, f, X, Y, roots, cmap='plasma', digits=5):
+    ax.plot(X, Y, label="f(x)", color=CYAN, linewidth=2)
+    ax.axhline(0, color=MAGENTA, linestyle='--', linewidth=1)
+    for i, (root, color) in enumerate(zip(roots, palette(len(roots), cmap))):
+        y = f(root)
+        ax.plot(root, y, 'o', color=color, label=f'Root {i+1}: {root:.{digits}f}')
+        ax.annotate(f'{root:.{digits}f}', (root, y), textcoords="offset points", xytext=(0, 10),
+                    ha='center', fontsize=9, color=color)
@@ -1,9 +1,16 @@
+import time
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
-import matplotlib.cm as cm
 import streamlit as st
 
+from methods.export import trace_download_ui
+from methods.plotting import cyberpunk_plot, plot_function_roots
+
+REGULA_FALSI_COLUMNS = [
+    "Bracket", "Iteration", "Xl", "Xu", "Xr", "Approx. Error (%)",
+    "f(Xl)", "f(Xu)", "f(Xr)", "f(Xl) * f(Xr)"
+]
+
 # --- Regula Falsi Core Algorithm ---
 def regula_falsi_method(f, a, b, tol=1e-5, max_iter=100, bracket_id=None):
     fa, fb = f(a), f(b)
@@ -52,10 +59,11 @@ def regula_falsi_method(f, a, b, tol=1e-5, max_iter=100, bracket_id=None):
     return roots, rows
 
 # --- Root Scanner Across Interval ---
-def regula_falsi_all_roots(f, x_range, step=0.5, tol=1e-5, max_iter=100):
+def regula_falsi_all_roots(f, x_range, step=0.5, tol=1e-5, max_iter=100, sink=None):
     a_start, b_end = x_range
     roots = []
     all_rows = []
+    emit = sink.write_rows if sink is not None else all_rows.extend
     bracket_id = 1
 
     current = a_start
@@ -65,7 +73,7 @@ def regula_falsi_all_roots(f, x_range, step=0.5, tol=1e-5, max_iter=100):
 
         if (fa * fb < 0) or abs(fa) < tol or abs(fb) < tol:
             local_roots, rows = regula_falsi_method(f, a, b, tol, max_iter, bracket_id)
-            all_rows.extend(rows)
+            emit(rows)
             for r in local_roots:
                 if not any(abs(r - existing) < tol for existing in roots):
                     roots.append(r)
@@ -82,7 +90,10 @@ def regula_falsi_ui(f, x_range):
     max_iter = 100
 
     a, b = x_range
+    start = time.perf_counter()
     roots, table = regula_falsi_all_roots(f, x_range, step, tol, max_iter)
+    solve_time = time.perf_counter() - start
+    evaluations = f.points
 
     # 🔧 Summary Panel
     st.markdown(f"""
@@ -123,10 +134,7 @@ def regula_falsi_ui(f, x_range):
     # 📋 Full Iteration Table
     with st.expander("📋 Full Regula Falsi Iteration Table"):
         if table:
-            df = pd.DataFrame(table, columns=[
-                "Bracket", "Iteration", "Xl", "Xu", "Xr", "Approx. Error (%)",
-                "f(Xl)", "f(Xu)", "f(Xr)", "f(Xl) * f(Xr)"
-            ])
+            df = pd.DataFrame(table, columns=REGULA_FALSI_COLUMNS)
             df["Approx. Error (%)"] = df["Approx. Error (%)"].apply(
                 lambda x: f"{x:.6f}" if pd.notnull(x) else "–"
             )
@@ -135,6 +143,8 @@ def regula_falsi_ui(f, x_range):
                 'background-color': '#1a1a2e',
                 'border-color': '#ff00ff'
             }))
+            trace_download_ui(lambda sink: regula_falsi_all_roots(f, x_range, step, tol, max_iter, sink=sink),
+                              REGULA_FALSI_COLUMNS, "regula_falsi")
         else:
             st.info("No iterations performed — roots may lie exactly at interval endpoints.")
 
@@ -142,25 +152,7 @@ def regula_falsi_ui(f, x_range):
     X = np.linspace(*x_range, 500)
     Y = f(X)
 
-    plt.style.use("dark_background")
-    fig, ax = plt.subplots(figsize=(8, 5))
-    ax.plot(X, Y, label='f(x)', color="#00fff7", linewidth=2)
-    ax.axhline(0, color='#ff00ff', linestyle='--', linewidth=1)
-
-    cmap = cm.get_cmap('plasma', len(roots))
-    for i, root in enumerate(roots):
-        color = cmap(i)
-        ax.plot(root, f(root), 'o', color=color, label=f'Root {i+1}: {root:.5f}')
-        ax.annotate(f"{root:.5f}", (root, f(root)),
-                    textcoords="offset points", xytext=(0, 10),
-                    ha='center', fontsize=9, color=color)
-
-    ax.set_xlabel("x", fontsize=12, color="#ff00ff")
-    ax.set_ylabel("f(x)", fontsize=12, color="#ff00ff")
-    ax.set_title("🔦 Function Plot with Detected Roots (Regula Falsi)", fontsize=14, color="#ff00ff", weight='bold')
-    ax.tick_params(axis='x', colors='#00fff7')
-    ax.tick_params(axis='y', colors='#00fff7')
-    ax.legend(frameon=False)
-    st.pyplot(fig)
-
-    return roots
+    with cyberpunk_plot("🔦 Function Plot with Detected Roots (Regula Falsi)") as ax:
+        plot_function_roots(ax, f, X, Y, roots)
+
+    return roots, {"iterations": len(table), "solve_time": solve_time, "evaluations": evaluations}
@@ -1,9 +1,16 @@
+import time
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
-import matplotlib.cm as cm
 import streamlit as st
 
+from methods.export import trace_download_ui
+from methods.plotting import cyberpunk_plot, plot_function_roots
+from methods.seeding import scan_seeds, LaunchGuard, new_report, record_launch, report_summary, LAUNCH_COLUMNS
+
+SECANT_COLUMNS = [
+    "Init x₀", "Init x₁", "Iteration", "x₀", "x₁", "f(x₀)", "f(x₁)", "x₂", "Approx. Rel. Error (%)"
+]
+
 def secant_method(f, x0, x1, tol=1e-5, max_iter=100):
     rows = []
     for i in range(1, max_iter + 1):
@@ -18,28 +25,104 @@ def secant_method(f, x0, x1, tol=1e-5, max_iter=100):
         x0, x1 = x1, x2
     return (x2 if rows else None), rows
 
-def secant_all_roots(f, x_range, step=0.5, tol=1e-5, max_iter=100):
+def secant_all_roots(f, x_range, step=0.5, tol=1e-5, max_iter=100, sink=None):
     roots = []
     all_rows = []
+    emit = sink.write_rows if sink is not None else all_rows.extend
     x_vals = np.arange(x_range[0], x_range[1], step)
 
     for i in range(len(x_vals) - 1):
         x0, x1 = x_vals[i], x_vals[i + 1]
         root, rows = secant_method(f, x0, x1, tol, max_iter)
-        for r in rows:
-            all_rows.append([x0, x1] + r)
+        emit([x0, x1] + r for r in rows)
         if root is not None and not any(abs(root - r0) < tol for r0 in roots):
             roots.append(root)
 
     return roots, all_rows
 
+# --- Guarded launch: stops as soon as the iterate leaves, cycles or repeats a known root ---
+def secant_guarded(f, x0, x1, guard, tol=1e-5, max_iter=100, bracketed=False):
+    rows = []
+    fx0 = f(x0)
+    lo, flo, hi = x0, fx0, x1
+    for i in range(1, max_iter + 1):
+        fx1 = f(x1)
+        if fx1 == 0:
+            return x1, rows, 'Converged'
+        if i == 1:
+            scale = max(abs(fx0), abs(fx1))
+        if bracketed:
+            # x0 and x1 straddle a sign change: keep the bracket tight around it
+            if (fx1 > 0) == (flo > 0):
+                lo, flo = x1, fx1
+            else:
+                hi = x1
+        if fx1 - fx0 == 0:
+            return None, rows, 'Flat secant'
+        x2 = x1 - fx1 * (x1 - x0) / (fx1 - fx0)
+        if bracketed and not min(lo, hi) < x2 < max(lo, hi):
+            # Secant step left the bracket: bisect it instead (a false-position step can stall
+            # next to an end where f is tiny)
+            x2 = (lo + hi) / 2
+        ea = abs((x2 - x1) / x2) * 100 if x2 != 0 else None
+        rows.append([i, x0, x1, fx0, fx1, x2, ea])
+        if ea is not None and ea < tol:
+            if not bracketed:
+                return x2, rows, 'Converged'
+            if abs(fx1) > 1e-3 * scale:
+                # The bracket closed in on a point where |f| grew: a pole (tan, 1/x), not a root
+                return None, rows, 'Pole (sign change without root)'
+            # Steps are also tiny next to a bracket end where f is small: accept only if f
+            # changes sign just past x2, otherwise move that end up and bisect
+            probe = x2 + (x2 - x1)
+            if not min(lo, hi) < probe < max(lo, hi):
+                return x2, rows, 'Converged'
+            fp = f(probe)
+            if fp == 0 or (fp > 0) != (fx1 > 0):
+                return x2, rows, 'Converged'
+            if (fp > 0) == (flo > 0):
+                lo, flo = probe, fp
+            else:
+                hi = probe
+            x2 = (lo + hi) / 2
+        status = guard.check(x2, fx1)
+        if status:
+            return None, rows, status
+        x0, x1, fx0 = x1, x2, fx1
+    return None, rows, 'Max iterations'
+
+def secant_seeded_roots(f, x_range, step=0.5, tol=1e-5, max_iter=100, sink=None):
+    roots = []
+    all_rows = []
+    emit = sink.write_rows if sink is not None else all_rows.extend
+    report = new_report(max(len(np.arange(x_range[0], x_range[1], step)) - 1, 0), max_iter)
+
+    for seed, lo, hi, kind in scan_seeds(f, x_range, step):
+        if kind == 'Sign change':
+            x0, x1 = lo, hi
+        else:
+            # Start from the seed itself, the second point halfway across its side of the cell
+            x0, x1 = seed, (lo + hi) / 2 if lo != hi else seed + step / 2
+        bracketed = kind == 'Sign change'
+        guard = LaunchGuard(x_range, roots, bracket=(lo, hi) if bracketed else None)
+        root, rows, status = secant_guarded(f, x0, x1, guard, tol, max_iter, bracketed=bracketed)
+        emit([x0, x1] + r for r in rows)
+        record_launch(report, (x0, x1), kind, status, len(rows), root)
+        if root is not None and not any(abs(root - r0) < tol for r0 in roots):
+            roots.append(root)
+
+    return roots, all_rows, report
+
 def secant_ui(f, x_range):
     tol = 1e-5
     max_iter = 100
     step = st.number_input("Initial-guess pair step:", min_value=0.01, max_value=10.0, value=0.5, step=0.1, format="%.2f")
     st.markdown(f"<small style='color:#00fff7;'>Scanning initial pairs from <strong>{x_range[0]}</strong> to <strong>{x_range[1]}</strong> in steps of <strong>{step}</strong>.</small>", unsafe_allow_html=True)
 
-    roots, table = secant_all_roots(f, x_range, step, tol, max_iter)
+    start = time.perf_counter()
+    roots, table, report = secant_seeded_roots(f, x_range, step, tol, max_iter)
+    solve_time = time.perf_counter() - start
+    evaluations = f.points
 
     # ⚙️ Method Summary
     st.markdown(f"""
@@ -59,6 +142,9 @@ def secant_ui(f, x_range):
             <p style='margin-top: 0.5rem; color: #00fff7;'>
                 {f"{len(roots)} root(s) found: " + ', '.join(f'{r:.5f}' for r in roots) if roots else "No roots found."}
             </p>
+            <p style='margin-top: 0.5rem; color: #00fff7;'>
+                🚀 {report_summary(report)}
+            </p>
         </div>
     """, unsafe_allow_html=True)
 
@@ -77,39 +163,33 @@ def secant_ui(f, x_range):
     else:
         st.warning("No roots found in the given range.")
 
+    # 🚀 Launch Log
+    with st.expander("🚀 Secant Method Launch Log"):
+        st.dataframe(pd.DataFrame(
+            [[f"({r[0][0]:.4f}, {r[0][1]:.4f})"] + r[1:] for r in report['log']],
+            columns=LAUNCH_COLUMNS
+        ).style.set_properties(**{
+            'color': '#00fff7',
+            'background-color': '#1a1a2e',
+            'border-color': '#ff00ff'
+        }))
+
     # 🧮 Iteration Table
     with st.expander("📋 Secant Method Iteration Table"):
-        iter_df = pd.DataFrame(table, columns=[
-            "Init x₀", "Init x₁", "Iteration", "x₀", "x₁", "f(x₀)", "f(x₁)", "x₂", "Approx. Rel. Error (%)"
-        ])
+        iter_df = pd.DataFrame(table, columns=SECANT_COLUMNS)
         st.dataframe(iter_df.style.set_properties(**{
             'color': '#00fff7',
             'background-color': '#1a1a2e',
             'border-color': '#ff00ff'
         }))
+        trace_download_ui(lambda sink: secant_seeded_roots(f, x_range, step, tol, max_iter, sink=sink), SECANT_COLUMNS,
+                          "secant")
 
     # 📈 Plot
     X = np.linspace(*x_range, 500)
     Y = f(X)
 
-    plt.style.use("dark_background")
-    fig, ax = plt.subplots(figsize=(8, 5))
-    ax.plot(X, Y, label="f(x)", color="#00fff7", linewidth=2)
-    ax.axhline(0, color='#ff00ff', linestyle="--", linewidth=1)
-
-    cmap = cm.get_cmap("plasma", len(roots))
-    for i, root in enumerate(roots):
-        color = cmap(i)
-        ax.plot(root, f(root), "o", color=color, label=f"Root {i+1}: {root:.5f}")
-        ax.annotate(f"{root:.5f}", (root, f(root)), textcoords="offset points",
-                    xytext=(0, 10), ha="center", fontsize=9, color=color)
-
-    ax.set_xlabel("x", fontsize=12, color="#ff00ff")
-    ax.set_ylabel("f(x)", fontsize=12, color="#ff00ff")
-    ax.set_title("🔦 Function Plot with Detected Roots (Secant Method)", fontsize=14, color="#ff00ff", weight="bold")
-    ax.tick_params(axis='x', colors='#00fff7')
-    ax.tick_params(axis='y', colors='#00fff7')
-    ax.legend(frameon=False)
-    st.pyplot(fig)
-
-    return roots
+    with cyberpunk_plot("🔦 Function Plot with Detected Roots (Secant Method)") as ax:
+        plot_function_roots(ax, f, X, Y, roots)
+
+    return roots, {"iterations": len(table), "solve_time": solve_time, "evaluations": evaluations}
@@ -0,0 +1,141 @@
+import numpy as np
+
+
+# --- Coarse sign / derivative scan ---
+def _false_position(xl, xr, yl, yr):
+    return xl - yl * (xr - xl) / (yr - yl)
+
+
+def _slopes(f, df, X, Y):
+    if df is not None:
+        return np.broadcast_to(np.asarray(df(X), dtype=float), np.shape(X))
+    # No f': forward differences, one more call on the same points
+    Xh = X + 1e-7 * np.maximum(1.0, np.abs(X))
+    return (np.broadcast_to(np.asarray(f(Xh), dtype=float), np.shape(X)) - Y) / (Xh - X)
+
+
+def _locate_extremum(f, df, xl, xr, yl, dl, dr, steps=3):
+    # Illinois regula falsi on f' inside the cell, stopping as soon as f changes sign at the
+    # estimate: the extremum then splits the cell into two proper brackets
+    side = 0
+    for _ in range(steps):
+        xe = _false_position(xl, xr, dl, dr)
+        ye = float(f(xe))
+        if ye * yl <= 0:
+            return xe, ye
+        de = float(_slopes(f, df, xe, ye))
+        if not (np.isfinite(ye) and np.isfinite(de)):
+            break
+        if de * dl > 0:
+            xl, dl = xe, de
+            dr, side = (dr / 2 if side == -1 else dr), -1
+        else:
+            xr, dr = xe, de
+            dl, side = (dl / 2 if side == 1 else dl), 1
+    return xe, None
+
+
+def scan_seeds(f, x_range, step=0.5, df=None):
+    a, b = x_range
+    X = np.arange(a, b + 1e-9, step)
+    if X[-1] < b:
+        X = np.append(X, b)
+    with np.errstate(all='ignore'):
+        Y = np.broadcast_to(np.asarray(f(X), dtype=float), X.shape)
+        dY = _slopes(f, df, X, Y)
+
+    seeds = []
+    for i in range(len(X) - 1):
+        xl, xr, yl, yr = X[i], X[i + 1], Y[i], Y[i + 1]
+        if not (np.isfinite(yl) and np.isfinite(yr)):
+            continue
+        if yl == 0:
+            seeds.append((xl, xl, xr, 'Exact zero'))
+            # The rest of the cell can hold more roots: look at it again from just past the zero
+            xl = xl + 1e-7 * max(1.0, abs(xl))
+            with np.errstate(all='ignore'):
+                yl = float(f(xl))
+            if not np.isfinite(yl) or yl == 0:
+                continue
+        if yl * yr < 0:
+            # Start from the false-position point of the bracket
+            seeds.append((_false_position(xl, xr, yl, yr), xl, xr, 'Sign change'))
+        elif np.isfinite(dY[i]) and np.isfinite(dY[i + 1]) and dY[i] * dY[i + 1] < 0 and (yl > 0) == (dY[i] < 0):
+            # f' changes sign with f bending back towards zero: a touching root, or two roots
+            # either side of the extremum inside this cell
+            with np.errstate(all='ignore'):
+                xe, ye = _locate_extremum(f, df, xl, xr, yl, dY[i], dY[i + 1])
+            # Launch once from each side of the extremum, from the outer end: f' is near zero
+            # next to the extremum itself
+            kind = 'Sign change' if ye is not None else 'Extremum towards zero'
+            seeds.append((xl, xl, xe, kind))
+            seeds.append((xr, xe, xr, kind))
+    if len(X) and Y[-1] == 0:
+        seeds.append((X[-1], X[-1], X[-1], 'Exact zero'))
+
+    return seeds
+
+
+# --- Runtime guards for one launch ---
+class LaunchGuard:
+    def __init__(self, x_range, known_roots, margin=0.1, stall_window=10, bracket=None):
+        width = x_range[1] - x_range[0]
+        self.lo = x_range[0] - margin * width
+        self.hi = x_range[1] + margin * width
+        self.known_roots = known_roots
+        self.stall_window = stall_window
+        # A sign-change bracket shrinks every step: no stall or cycle check, and only roots inside it repeat
+        self.bracket = (min(bracket), max(bracket)) if bracket is not None else None
+        self.history = []
+        self.residuals = []
+
+    def check(self, x_new, fx):
+        if not np.isfinite(x_new):
+            return 'Diverged'
+        if not self.lo <= x_new <= self.hi:
+            return 'Left interval'
+        scale = max(1.0, abs(x_new))
+        if self.bracket is None and any(abs(x_new - h) <= 1e-12 * scale for h in self.history[:-1]):
+            return 'Cycling'
+        if self.history and abs(x_new - self.history[-1]) <= 1e-3 * scale \
+                and any(abs(x_new - r) <= 1e-3 * scale for r in self.known_roots
+                        if self.bracket is None or self.bracket[0] <= r <= self.bracket[1]):
+            return 'Duplicate of known root'
+        self.residuals.append(abs(fx))
+        if self.bracket is None and len(self.residuals) > self.stall_window \
+                and min(self.residuals[-self.stall_window:]) >= self.residuals[-self.stall_window - 1]:
+            return 'Stalled'
+        self.history.append(x_new)
+        return None
+
+
+def new_report(grid_launches, max_iter):
+    return {
+        'grid_launches': grid_launches,
+        'launches': 0,
+        'iterations': 0,
+        'max_iter': max_iter,
+        'abandoned': {},
+        'abandoned_iterations_saved': 0,
+        'log': [],
+    }
+
+
+def record_launch(report, seed, kind, status, iterations, root):
+    report['launches'] += 1
+    report['iterations'] += iterations
+    if status not in ('Converged', 'Max iterations'):
+        report['abandoned'][status] = report['abandoned'].get(status, 0) + 1
+        report['abandoned_iterations_saved'] += report['max_iter'] - iterations
+    report['log'].append([seed, kind, status, iterations, root])
+
+
+LAUNCH_COLUMNS = ["Seed", "Seed Kind", "Outcome", "Iterations", "Root"]
+
+
+def report_summary(report):
+    skipped = report['grid_launches'] - report['launches']
+    abandoned = ', '.join(f"{count} {reason.lower()}" for reason, count in report['abandoned'].items()) or 'none'
+    return (f"{report['launches']} launch(es) instead of {report['grid_launches']} blind grid launches "
+            f"({max(skipped, 0)} skipped), {report['iterations']} iteration(s) in total. "
+            f"Abandoned early: {abandoned}, saving up to {report['abandoned_iterations_saved']} iteration(s).")
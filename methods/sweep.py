@@ -0,0 +1,233 @@
+import time
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from methods.expression import compile_expression
+from methods.newton_raphson import newton_raphson_seeded_roots
+from methods.telemetry import CountingFunction
+from methods.export import trace_download_ui, trace_output_ui, trace_sink
+from methods.plotting import cyberpunk_plot, palette
+
+SWEEP_COLUMNS = ["Parameter", "Branch", "Root", "Converged", "Iterations"]
+
+
+def _evaluate(func, x, p):
+    return np.broadcast_to(np.asarray(func(x, p), dtype=float), x.shape)
+
+
+# --- Vectorized Newton: one iterate per parameter value ---
+def newton_sweep(f, df, params, x0, tol=1e-10, max_iter=50):
+    params = np.asarray(params, dtype=float)
+    x = np.array(np.broadcast_to(x0, params.shape), dtype=float)
+    iterations = np.zeros(params.shape, dtype=int)
+    active = np.isfinite(x)
+
+    with np.errstate(all='ignore'):
+        for _ in range(max_iter):
+            idx = np.flatnonzero(active)
+            if idx.size == 0:
+                break
+            xa, pa = x[idx], params[idx]
+            fx, dfx = _evaluate(f, xa, pa), _evaluate(df, xa, pa)
+            ok = (dfx != 0) & np.isfinite(fx) & np.isfinite(dfx)
+            step = np.where(ok, fx / np.where(ok, dfx, 1.0), 0.0)
+            x[idx] = xa - step
+            iterations[idx] += 1
+            done = ~ok | (np.abs(step) <= tol * (1 + np.abs(x[idx])))
+            active[idx[done]] = False
+
+        residual = np.abs(_evaluate(f, x, params))
+    converged = ~active & np.isfinite(x) & (residual <= np.sqrt(tol))
+    return x, converged, iterations
+
+
+# --- Vectorized secant: two iterates per parameter value ---
+def secant_sweep(f, params, x0, tol=1e-10, max_iter=50, h=1e-4):
+    params = np.asarray(params, dtype=float)
+    x_prev = np.array(np.broadcast_to(x0, params.shape), dtype=float)
+    x = x_prev + h * (1 + np.abs(x_prev))
+    iterations = np.zeros(params.shape, dtype=int)
+    active = np.isfinite(x)
+
+    with np.errstate(all='ignore'):
+        f_prev = np.array(_evaluate(f, x_prev, params))
+        for _ in range(max_iter):
+            idx = np.flatnonzero(active)
+            if idx.size == 0:
+                break
+            xa, pa = x[idx], params[idx]
+            fx = _evaluate(f, xa, pa)
+            slope = fx - f_prev[idx]
+            ok = (slope != 0) & np.isfinite(fx)
+            step = np.where(ok, fx * (xa - x_prev[idx]) / np.where(ok, slope, 1.0), 0.0)
+            x_prev[idx], f_prev[idx] = xa, fx
+            x[idx] = xa - step
+            iterations[idx] += 1
+            done = ~ok | (np.abs(step) <= tol * (1 + np.abs(x[idx])))
+            active[idx[done]] = False
+
+        residual = np.abs(_evaluate(f, x, params))
+    converged = ~active & np.isfinite(x) & (residual <= np.sqrt(tol))
+    return x, converged, iterations
+
+
+# --- Continuation along the parameter grid ---
+def _trace(solve, params, x0, coarse_points, max_jump):
+    n = params.size
+
+    def accept(j, guess):
+        root, converged, _ = solve(params[j:j + 1], guess)
+        if converged[0] and abs(root[0] - guess) <= max_jump:
+            return root[0]
+        return None
+
+    # Coarse pass: walk the grid in order, each value starting from the last solution.
+    # A failed step is halved until the branch ends between two neighbouring grid points.
+    known_idx, known_roots = [], []
+    guess = accept(0, x0)
+    if guess is not None:
+        known_idx.append(0)
+        known_roots.append(guess)
+        j_prev = 0
+        for j in np.unique(np.linspace(0, n - 1, min(n, coarse_points)).astype(int))[1:]:
+            target = j
+            while j_prev < j:
+                root = accept(target, guess)
+                if root is not None:
+                    j_prev, guess = target, root
+                    known_idx.append(target)
+                    known_roots.append(root)
+                    target = j
+                elif target - j_prev > 1:
+                    target = (j_prev + target) // 2
+                else:
+                    break
+            if j_prev < j:
+                break
+
+    roots = np.full(n, np.nan)
+    converged = np.zeros(n, dtype=bool)
+    iterations = np.zeros(n, dtype=int)
+    if not known_idx:
+        return roots, converged, iterations
+
+    # Fine pass: every value on the traced stretch at once, warm-started from the interpolated branch
+    last = known_idx[-1] + 1
+    guesses = np.interp(np.arange(last), known_idx, known_roots)
+    roots[:last], converged[:last], iterations[:last] = solve(params[:last], guesses)
+    converged &= np.abs(roots - np.interp(np.arange(n), known_idx, known_roots)) <= max_jump
+    roots[~converged] = np.nan
+    return roots, converged, iterations
+
+
+def continuation_sweep(f, df, params, x0, coarse_points=200, tol=1e-10, max_iter=50, method='newton', max_jump=np.inf,
+                       start=0):
+    params = np.asarray(params, dtype=float)
+
+    def solve(p, guess):
+        if method == 'secant':
+            return secant_sweep(f, p, guess, tol, max_iter)
+        return newton_sweep(f, df, p, guess, tol, max_iter)
+
+    # Trace forwards from params[start], and backwards when the branch was found inside the grid
+    forward = _trace(solve, params[start:], x0, coarse_points, max_jump)
+    if start == 0:
+        return forward
+    backward = _trace(solve, params[start::-1], x0, coarse_points, max_jump)
+    return tuple(np.concatenate([b[:0:-1], fw]) for b, fw in zip(backward, forward))
+
+
+def sweep_roots(f, df, params, x_range, step=0.5, tol=1e-10, max_iter=50, method='newton', sink=None, probes=9):
+    params = np.asarray(params, dtype=float)
+    max_jump = 0.1 * (x_range[1] - x_range[0])
+    branches = []
+
+    # Branches can appear or end anywhere in the grid: look for roots at a few coarse parameter
+    # values and trace every root no existing branch passes through, in both directions
+    for k in np.unique(np.linspace(0, params.size - 1, min(params.size, probes)).astype(int)):
+        pk = params[k]
+        found, _, _ = newton_raphson_seeded_roots(
+            lambda x: f(x, pk), lambda x: df(x, pk), x_range, step, 1e-5, max_iter
+        )
+        for r in sorted(found):
+            if not x_range[0] <= r <= x_range[1] \
+                    or any(abs(b[1][k] - r) <= 1e-6 * (1 + abs(r)) for b in branches):
+                continue
+            roots, converged, iterations = continuation_sweep(
+                f, df, params, r, tol=tol, max_iter=max_iter, method=method, max_jump=max_jump, start=k
+            )
+            if not converged[k] or any(abs(b[1][k] - roots[k]) < 1e-8 for b in branches):
+                continue
+            first = int(np.argmax(converged))
+            branches.append((roots[first], roots, converged, iterations))
+            if sink is not None:
+                sink.write_rows(zip(params, np.full(params.size, len(branches)), roots, converged, iterations))
+
+    return [b[0] for b in branches], branches
+
+
+def sweep_ui(f_expr_input, x_range):
+    c1, c2, c3, c4, c5 = st.columns(5)
+    param = c1.text_input("Parameter symbol", value="p", key="sweep_param")
+    p_start = c2.number_input("Parameter start", value=0.0, format="%.4f", key="sweep_p_start")
+    p_end = c3.number_input("Parameter end", value=1.0, format="%.4f", key="sweep_p_end")
+    n_points = c4.number_input("Grid points", min_value=2, max_value=100000, value=1000, step=100, key="sweep_n")
+    method = c5.selectbox("Iteration", ["newton", "secant"], key="sweep_method")
+    output = trace_output_ui("sweep")
+
+    f, df, _, _ = compile_expression(f_expr_input, variables=('x', param.strip()))
+    f, df = CountingFunction(f), CountingFunction(df)
+    params = np.linspace(p_start, p_end, int(n_points))
+    start = time.perf_counter()
+    with trace_sink(output, SWEEP_COLUMNS) as sink:
+        start_roots, branches = sweep_roots(f, df, params, x_range, method=method, sink=sink)
+    solve_time = time.perf_counter() - start
+    evaluations = f.points + df.points
+    if sink is not None:
+        st.info(f"💾 {sink.rows_written} row(s) written to {sink.path}")
+
+    converged_total = sum(int(b[2].sum()) for b in branches)
+    iterations_total = sum(int(b[3].sum()) for b in branches)
+
+    # 🔁 Sweep Summary
+    st.markdown(f"""
+        <div style='
+            border: 2px solid #ff00ff;
+            background-color: #12122a;
+            border-radius: 12px;
+            padding: 1.2rem;
+            box-shadow: 0 0 15px #00fff733;
+            margin-bottom: 1.5rem;
+        '>
+            <h4 style='margin: 0; color: #ff00ff;'>🔁 Parameter Sweep Summary</h4>
+            <p style='margin-top: 0.5rem; color: #00fff7;'>
+                {param} ∈ <strong>[{p_start}, {p_end}]</strong> | Points: <strong>{int(n_points)}</strong> |
+                Branches: <strong>{len(branches)}</strong> | Iteration: <strong>{method}</strong>
+            </p>
+            <p style='margin-top: 0.5rem; color: #00fff7;'>
+                {converged_total} of {len(branches) * int(n_points)} branch point(s) converged in {iterations_total} vectorized iteration step(s).
+            </p>
+        </div>
+    """, unsafe_allow_html=True)
+
+    # 📋 Root-versus-parameter table
+    with st.expander("📋 Root vs. Parameter Table"):
+        table = {param: params}
+        for i, (_, roots, _, _) in enumerate(branches):
+            table[f"Branch {i+1}"] = roots
+        st.dataframe(pd.DataFrame(table).style.set_properties(**{
+            'color': '#00fff7',
+            'background-color': '#1a1a2e',
+            'border-color': '#ff00ff'
+        }))
+        trace_download_ui(lambda sink: sweep_roots(f, df, params, x_range, method=method, sink=sink), SWEEP_COLUMNS,
+                          "sweep")
+
+    # 📈 Plot
+    with cyberpunk_plot("🔦 Root Branches vs. Parameter", xlabel=param, ylabel="root x") as ax:
+        for i, ((r0, roots, converged, _), color) in enumerate(zip(branches, palette(len(branches)))):
+            p0 = params[np.argmax(converged)]
+            ax.plot(params, roots, color=color, linewidth=2, label=f'Branch {i+1} (from {param} = {p0:.4f}, x = {r0:.4f})')
+
+    return start_roots, {"iterations": iterations_total, "solve_time": solve_time, "evaluations": evaluations}
@@ -0,0 +1,255 @@
+import time
+import itertools
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+from sympy import Matrix, Symbol, lambdify
+
+from methods.expression import parse_expression, run_with_timeout, expression_cost, TIMEOUT, MAX_COST
+from methods.telemetry import CountingFunction
+from methods.export import trace_download_ui, trace_output_ui, trace_sink
+from methods.plotting import cyberpunk_plot, palette
+
+MAX_STARTS = 20000
+
+
+# --- Compile F and its Jacobian once ---
+def compile_system(equations, variables, timeout=TIMEOUT, max_cost=MAX_COST):
+    variables = tuple(variables)
+    if len(equations) != len(variables):
+        raise ValueError(f"{len(equations)} equation(s) given for {len(variables)} unknown(s)")
+
+    symbols_ = [Symbol(v, real=True) for v in variables]
+    F_exprs = [parse_expression(eq, variables, timeout) for eq in equations]
+    J_expr = run_with_timeout(lambda: Matrix(F_exprs).jacobian(symbols_), timeout, "differentiation")
+
+    cost = run_with_timeout(lambda: expression_cost(F_exprs + list(J_expr)), timeout, "cost estimation")
+    if cost > max_cost * len(variables):
+        raise ValueError(f"F and J need {cost} operations per evaluation (budget is {max_cost * len(variables)})")
+
+    F_raw = lambdify(symbols_, F_exprs, modules='numpy', cse=True)
+    J_raw = lambdify(symbols_, list(J_expr), modules='numpy', cse=True)
+    n = len(variables)
+
+    # Both callables take a (batch, n) array and return (batch, n) and (batch, n, n)
+    def F(X):
+        X = np.atleast_2d(X)
+        values = F_raw(*X.T)
+        return np.stack([np.broadcast_to(np.asarray(v, dtype=float), X.shape[:1]) for v in values], axis=1)
+
+    def J(X):
+        X = np.atleast_2d(X)
+        values = J_raw(*X.T)
+        flat = np.stack([np.broadcast_to(np.asarray(v, dtype=float), X.shape[:1]) for v in values], axis=1)
+        return flat.reshape(-1, n, n)
+
+    return F, J, F_exprs, J_expr
+
+
+# --- Newton with the analytic Jacobian, many starting points at once ---
+def newton_system(F, J, X0, tol=1e-10, max_iter=50):
+    X = np.array(np.atleast_2d(X0), dtype=float)
+    batch = X.shape[0]
+    active = np.ones(batch, dtype=bool)
+    converged = np.zeros(batch, dtype=bool)
+    rows = []
+    start = time.perf_counter()
+
+    with np.errstate(all='ignore'):
+        FX = F(X)
+        for i in range(1, max_iter + 1):
+            idx = np.flatnonzero(active)
+            if idx.size == 0:
+                break
+            Jx = J(X[idx])
+            solvable = np.isfinite(Jx).all(axis=(1, 2)) & np.isfinite(FX[idx]).all(axis=1) \
+                & (np.abs(np.linalg.det(Jx)) > 1e-300)
+            active[idx[~solvable]] = False
+            idx, Jx = idx[solvable], Jx[solvable]
+            if idx.size == 0:
+                break
+
+            dX = np.linalg.solve(Jx, -FX[idx][..., None])[..., 0]
+            X[idx] += dX
+            FX[idx] = F(X[idx])
+
+            residual = np.linalg.norm(FX[idx], axis=1)
+            step = np.linalg.norm(dX, axis=1)
+            elapsed = time.perf_counter() - start
+            for k, s in enumerate(idx):
+                rows.append([s, i, *X[s], residual[k], step[k], elapsed])
+
+            done = step <= tol * (1 + np.linalg.norm(X[idx], axis=1))
+            converged[idx[done]] = residual[done] <= np.sqrt(tol)
+            active[idx[done]] = False
+
+    return X, converged, rows, time.perf_counter() - start
+
+
+# --- Broyden: one Jacobian evaluation, then rank-one updates of its inverse ---
+def broyden_system(F, J, X0, tol=1e-10, max_iter=100):
+    X = np.array(np.atleast_2d(X0), dtype=float)
+    batch = X.shape[0]
+    active = np.ones(batch, dtype=bool)
+    converged = np.zeros(batch, dtype=bool)
+    rows = []
+    start = time.perf_counter()
+
+    with np.errstate(all='ignore'):
+        FX = F(X)
+        J0 = J(X)
+        invertible = np.isfinite(J0).all(axis=(1, 2)) & (np.abs(np.linalg.det(J0)) > 1e-300)
+        active &= invertible & np.isfinite(FX).all(axis=1)
+        H = np.zeros_like(J0)
+        H[invertible] = np.linalg.inv(J0[invertible])
+
+        for i in range(1, max_iter + 1):
+            idx = np.flatnonzero(active)
+            if idx.size == 0:
+                break
+
+            dX = -np.einsum('bij,bj->bi', H[idx], FX[idx])
+            X[idx] += dX
+            F_new = F(X[idx])
+            dF = F_new - FX[idx]
+            FX[idx] = F_new
+
+            # Sherman–Morrison update of H = B⁻¹ ("good" Broyden)
+            H_dF = np.einsum('bij,bj->bi', H[idx], dF)
+            denom = np.einsum('bi,bi->b', dX, H_dF)
+            ok = np.isfinite(denom) & (np.abs(denom) > 1e-300) & np.isfinite(F_new).all(axis=1)
+            dX_H = np.einsum('bi,bij->bj', dX, H[idx])
+            update = np.einsum('bi,bj->bij', dX - H_dF, dX_H) / np.where(ok, denom, 1.0)[:, None, None]
+            H[idx[ok]] += update[ok]
+
+            residual = np.linalg.norm(F_new, axis=1)
+            step = np.linalg.norm(dX, axis=1)
+            elapsed = time.perf_counter() - start
+            for k, s in enumerate(idx):
+                rows.append([s, i, *X[s], residual[k], step[k], elapsed])
+
+            done = step <= tol * (1 + np.linalg.norm(X[idx], axis=1))
+            converged[idx[done]] = residual[done] <= np.sqrt(tol)
+            active[idx[done | ~ok]] = False
+
+    return X, converged, rows, time.perf_counter() - start
+
+
+# --- Tensor grid of starting points, capped in total size ---
+def starting_grid(x_range, per_axis, n, max_starts=MAX_STARTS):
+    per_axis = int(min(per_axis, np.floor(max_starts ** (1 / n) + 1e-9)))
+    axis = np.linspace(x_range[0], x_range[1], max(per_axis, 1))
+    return np.array(list(itertools.product(axis, repeat=n)))
+
+
+def system_columns(variables):
+    return ["Start #", "Iteration", *variables, "‖F‖", "‖Δx‖", "Elapsed (s)"]
+
+
+def system_all_roots(F, J, X0, method='newton', tol=1e-10, max_iter=100, batch_size=4096, sink=None):
+    solver = broyden_system if method == 'broyden' else newton_system
+    X0 = np.atleast_2d(np.asarray(X0, dtype=float))
+    roots = []
+    all_rows = []
+    emit = sink.write_rows if sink is not None else all_rows.extend
+    elapsed = 0.0
+
+    for b in range(0, X0.shape[0], batch_size):
+        X, converged, rows, seconds = solver(F, J, X0[b:b + batch_size], tol, max_iter)
+        elapsed += seconds
+        emit([r[0] + b] + r[1:] for r in rows)
+        for x in X[converged]:
+            if not any(np.linalg.norm(x - existing) < np.sqrt(tol) for existing in roots):
+                roots.append(x)
+
+    return roots, all_rows, elapsed
+
+
+def system_ui(x_range):
+    equations_input = st.text_area("Equations (one per line, each = 0)", value="x**2 + y**2 - 4\nx*y - 1",
+                                   key="system_equations")
+    c1, c2, c3, c4 = st.columns(4)
+    variables_input = c1.text_input("Unknowns", value="x, y", key="system_variables")
+    per_axis = c2.number_input("Starting points per axis", min_value=1, max_value=200, value=6, key="system_per_axis")
+    max_starts = c3.number_input("Max starting points", min_value=1, max_value=MAX_STARTS, value=5000,
+                                 key="system_max_starts")
+    method = c4.selectbox("Solver", ["newton", "broyden"], key="system_method")
+    output = trace_output_ui("system")
+
+    tol = 1e-10
+    variables = [v.strip() for v in variables_input.split(',') if v.strip()]
+    equations = [eq for eq in equations_input.splitlines() if eq.strip()]
+    F, J, _, _ = compile_system(equations, variables)
+    F, J = CountingFunction(F), CountingFunction(J)
+
+    X0 = starting_grid(x_range, per_axis, len(variables), max_starts)
+    if len(X0) < int(per_axis) ** len(variables):
+        st.warning(f"⚠️ {int(per_axis)}^{len(variables)} starting points exceed the limit of {int(max_starts)}; "
+                   f"using {len(X0)} instead.")
+    start = time.perf_counter()
+    with trace_sink(output, system_columns(variables)) as sink:
+        roots, table, elapsed = system_all_roots(F, J, X0, method, tol, sink=sink)
+    solve_time = time.perf_counter() - start
+    # Both callables take (batch, n) arrays: count evaluated points, not coordinates
+    evaluations = (F.points + J.points) // len(variables)
+    if sink is not None:
+        # Rows went to the file, not into memory: no iteration table or residual traces below
+        st.info(f"💾 {sink.rows_written} row(s) written to {sink.path}")
+
+    # 🧩 System Summary
+    st.markdown(f"""
+        <div style='
+            border: 2px solid #ff00ff;
+            background-color: #12122a;
+            border-radius: 12px;
+            padding: 1.2rem;
+            box-shadow: 0 0 15px #00fff733;
+            margin-bottom: 1.5rem;
+        '>
+            <h4 style='margin: 0; color: #ff00ff;'>🧩 System Summary</h4>
+            <p style='margin-top: 0.5rem; color: #00fff7;'>
+                Unknowns: <strong>{', '.join(variables)}</strong> | Starting points: <strong>{len(X0)}</strong> |
+                Solver: <strong>{method}</strong> | Solve time: <strong>{elapsed * 1000:.1f} ms</strong>
+            </p>
+            <p style='margin-top: 0.5rem; color: #00fff7;'>
+                {f"{len(roots)} distinct solution(s) found." if roots else "No solutions found."}
+            </p>
+        </div>
+    """, unsafe_allow_html=True)
+
+    # 📌 Solution Table
+    if roots:
+        root_df = pd.DataFrame(np.round(roots, 8), columns=variables)
+        root_df.insert(0, "Solution #", range(1, len(roots) + 1))
+        root_df["‖F‖"] = np.linalg.norm(F(np.array(roots)), axis=1)
+        st.dataframe(root_df.style.set_properties(**{
+            'color': '#00fff7',
+            'background-color': '#1a1a2e',
+            'border-color': '#ff00ff'
+        }))
+
+    if sink is not None:
+        return roots, {"iterations": sink.rows_written, "solve_time": solve_time, "evaluations": evaluations}
+
+    # 📋 Iteration Table
+    with st.expander(f"📋 {method.capitalize()} Iteration Table"):
+        iter_df = pd.DataFrame(table, columns=system_columns(variables))
+        st.dataframe(iter_df.style.set_properties(**{
+            'color': '#00fff7',
+            'background-color': '#1a1a2e',
+            'border-color': '#ff00ff'
+        }))
+        trace_download_ui(lambda sink: system_all_roots(F, J, X0, method, tol, sink=sink), system_columns(variables),
+                          "system")
+
+    # 📈 Residual traces
+    traces = {}
+    for r in table:
+        traces.setdefault(r[0], []).append((r[1], r[-3]))
+    with cyberpunk_plot(f"🔦 Residual Traces ({method.capitalize()})", xlabel="Iteration", ylabel="‖F(x)‖") as ax:
+        for trace, color in zip(traces.values(), palette(len(traces))):
+            its, residuals = zip(*trace)
+            ax.semilogy(its, np.maximum(residuals, 1e-300), color=color, linewidth=1, alpha=0.7)
+
+    return roots, {"iterations": len(table), "solve_time": solve_time, "evaluations": evaluations}
@@ -0,0 +1,140 @@
+import glob
+import hashlib
+import json
+import logging
+import os
+import time
+from logging.handlers import RotatingFileHandler
+
+import numpy as np
+import pandas as pd
+
+TELEMETRY_DIR = os.environ.get("ROOT_FINDER_TELEMETRY_DIR", os.path.join(os.path.expanduser("~"), ".root_finder"))
+TELEMETRY_FILE = "runs.jsonl"
+MAX_BYTES = 5 * 1024 * 1024
+BACKUP_COUNT = 5
+
+LATENCY_BUCKETS_MS = [1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, 30000]
+
+
+# --- Evaluation counting ---
+class CountingFunction:
+    def __init__(self, func):
+        self.func = func
+        self.reset()
+
+    def reset(self):
+        self.calls = 0
+        self.points = 0
+        self.seconds = 0.0
+
+    def __call__(self, *args):
+        start = time.perf_counter()
+        try:
+            return self.func(*args)
+        finally:
+            self.seconds += time.perf_counter() - start
+            self.calls += 1
+            self.points += int(np.size(args[0])) if args else 1
+
+
+def expression_hash(text):
+    return hashlib.sha256(" ".join(text.split()).encode("utf-8")).hexdigest()[:12]
+
+
+# --- Rotating JSON-lines log ---
+def _logger(directory):
+    logger = logging.getLogger(f"root_finder.telemetry.{directory}")
+    if not logger.handlers:
+        os.makedirs(directory, exist_ok=True)
+        handler = RotatingFileHandler(os.path.join(directory, TELEMETRY_FILE),
+                                      maxBytes=MAX_BYTES, backupCount=BACKUP_COUNT, encoding="utf-8")
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+    return logger
+
+
+def record_run(method, expression, x_range, outcome, wall_time, solve_time=None, iterations=None,
+               evaluations=None, roots=None, error=None, directory=None):
+    record = {
+        "timestamp": time.time(),
+        "method": method,
+        "expression_hash": expression_hash(expression),
+        "x_start": float(x_range[0]),
+        "x_end": float(x_range[1]),
+        "outcome": outcome,
+        "wall_ms": wall_time * 1000,
+        "solve_ms": solve_time * 1000 if solve_time is not None else None,
+        "render_ms": (wall_time - solve_time) * 1000 if solve_time is not None else None,
+        "iterations": iterations,
+        "evaluations": evaluations,
+        "roots": roots,
+        "error": error,
+    }
+    try:
+        _logger(directory or TELEMETRY_DIR).info(json.dumps(record))
+    except OSError:
+        # Telemetry must never break a solve
+        pass
+    return record
+
+
+def load_runs(directory=None):
+    directory = directory or TELEMETRY_DIR
+    records = []
+    for path in sorted(glob.glob(os.path.join(directory, TELEMETRY_FILE + "*"))):
+        with open(path, encoding="utf-8") as fh:
+            for line in fh:
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+    return pd.DataFrame(records)
+
+
+# --- Aggregation ---
+def timed_runs(runs, column="wall_ms"):
+    # Rejected expressions never ran a method; their zero latency would drag the percentiles down
+    if runs.empty:
+        return runs
+    return runs[runs["outcome"] != "rejected"].dropna(subset=[column])
+
+
+def latency_summary(runs, column="wall_ms"):
+    if runs.empty:
+        return pd.DataFrame(columns=["method", "runs", "errors", "mean", "p50", "p90", "p99", "max"])
+    grouped = runs.groupby("method")
+    summary = pd.DataFrame({
+        "runs": grouped.size(),
+        "errors": grouped["outcome"].apply(lambda s: int((s == "error").sum())),
+        "mean": grouped[column].mean(),
+        "p50": grouped[column].quantile(0.50),
+        "p90": grouped[column].quantile(0.90),
+        "p99": grouped[column].quantile(0.99),
+        "max": grouped[column].max(),
+    })
+    return summary.reset_index().sort_values("p90", ascending=False)
+
+
+def latency_histogram(runs, column="wall_ms", buckets=LATENCY_BUCKETS_MS):
+    edges = [0] + list(buckets) + [np.inf]
+    labels = [f"≤{b} ms" for b in buckets] + [f">{buckets[-1]} ms"]
+    if runs.empty:
+        return pd.DataFrame(columns=labels)
+    binned = pd.cut(runs[column], bins=edges, labels=labels, right=True)
+    return pd.crosstab(runs["method"], binned).reindex(columns=labels, fill_value=0)
+
+
+def hot_expressions(runs, column="wall_ms", top=20):
+    if runs.empty:
+        return pd.DataFrame(columns=["expression_hash", "runs", "total", "p90", "methods"])
+    grouped = runs.groupby("expression_hash")
+    hot = pd.DataFrame({
+        "runs": grouped.size(),
+        "total": grouped[column].sum(),
+        "p90": grouped[column].quantile(0.90),
+        "methods": grouped["method"].apply(lambda s: ", ".join(sorted(set(s)))),
+    })
+    return hot.reset_index().sort_values("total", ascending=False).head(top)
@@ -0,0 +1,80 @@
+import os
+
+import streamlit as st
+
+from methods.plotting import cyberpunk_plot, palette, CYAN
+from methods.telemetry import load_runs, timed_runs, latency_summary, latency_histogram, hot_expressions, \
+    TELEMETRY_DIR
+
+st.set_page_config(page_title="Root Finder Admin", layout="wide", page_icon="📊")
+
+st.markdown("<h1 style='color:magenta;'>📊 RUN TELEMETRY</h1>", unsafe_allow_html=True)
+
+# Closed unless an operator has set a token: telemetry reveals what users are solving
+token = os.environ.get("ROOT_FINDER_ADMIN_TOKEN")
+if not token:
+    st.error("❌ Telemetry is disabled: set ROOT_FINDER_ADMIN_TOKEN to open this page.")
+    st.stop()
+if st.text_input("Admin token", type="password", key="admin_token") != token:
+    st.warning("⚠️ Enter the admin token to view telemetry.")
+    st.stop()
+
+runs = load_runs()
+if runs.empty:
+    st.info(f"No runs recorded yet in {TELEMETRY_DIR}.")
+    st.stop()
+
+c1, c2 = st.columns(2)
+metric = c1.selectbox("Latency", ["wall_ms", "solve_ms", "render_ms"], key="admin_metric")
+methods = c2.multiselect("Methods", sorted(runs["method"].unique()), key="admin_methods")
+if methods:
+    runs = runs[runs["method"].isin(methods)]
+timed = timed_runs(runs, metric)
+
+# --- Overview ---
+st.markdown(f"""
+    <div style='
+        border: 2px solid #ff00ff;
+        background-color: #12122a;
+        border-radius: 12px;
+        padding: 1.2rem;
+        box-shadow: 0 0 15px #00fff733;
+        margin-bottom: 1.5rem;
+    '>
+        <h4 style='margin: 0; color: #ff00ff;'>📌 Overview</h4>
+        <p style='margin-top: 0.5rem; color: #00fff7;'>
+            Runs: <strong>{len(runs)}</strong> | Distinct expressions: <strong>{runs["expression_hash"].nunique()}</strong> |
+            Errors: <strong>{int((runs["outcome"] == "error").sum())}</strong> |
+            Rejected expressions: <strong>{int((runs["outcome"] == "rejected").sum())}</strong>
+        </p>
+    </div>
+""", unsafe_allow_html=True)
+
+# --- Percentiles ---
+st.markdown("<h3 style='color:#ff00ff;'>⏱️ Latency Percentiles (ms)</h3>", unsafe_allow_html=True)
+st.dataframe(latency_summary(timed, metric).style.format(precision=1).set_properties(**{
+    'color': '#00fff7',
+    'background-color': '#1a1a2e',
+    'border-color': '#ff00ff'
+}))
+
+# --- Histograms ---
+st.markdown("<h3 style='color:#ff00ff;'>📈 Latency Histograms</h3>", unsafe_allow_html=True)
+histogram = latency_histogram(timed, metric)
+st.dataframe(histogram)
+
+width = 0.8 / max(len(histogram), 1)
+with cyberpunk_plot(f"Latency Distribution per Method ({metric})", xlabel="", ylabel="Runs", figsize=(10, 5)) as ax:
+    for i, ((method, counts), color) in enumerate(zip(histogram.iterrows(), palette(len(histogram)))):
+        ax.bar([k + i * width for k in range(len(counts))], counts.values, width=width, color=color, label=method)
+    ax.set_xticks([k + 0.4 - width / 2 for k in range(len(histogram.columns))])
+    ax.set_xticklabels(histogram.columns, rotation=45, ha='right', color=CYAN)
+
+# --- Hot expressions ---
+st.markdown("<h3 style='color:#ff00ff;'>🔥 Hot Expressions</h3>", unsafe_allow_html=True)
+st.dataframe(hot_expressions(timed, metric).style.format(precision=1))
+
+# --- Recent runs ---
+with st.expander("📋 Recent Runs"):
+    recent = runs.sort_values("timestamp", ascending=False).head(500)
+    st.dataframe(recent)
@@ -0,0 +1,27 @@
+import pytest
+
+from methods.telemetry import CountingFunction
+from tests.polynomials import random_polynomial
+
+SEEDS = range(20)
+
+
+def _counting(f, df, roots):
+    return CountingFunction(f), CountingFunction(df), roots
+
+
+@pytest.fixture(params=SEEDS)
+def polynomial(request):
+    return _counting(*random_polynomial(request.param))
+
+
+@pytest.fixture(params=SEEDS)
+def close_pair(request):
+    # Two roots inside one 0.5 scan cell, plus up to two well-separated ones
+    return _counting(*random_polynomial(request.param, close_pair=True))
+
+
+@pytest.fixture(params=SEEDS)
+def on_grid(request):
+    # One root exactly on a 0.5 scan point, sometimes with a second one later in its cell
+    return _counting(*random_polynomial(request.param, on_grid=True))
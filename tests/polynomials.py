@@ -0,0 +1,49 @@
+import numpy as np
+
+X_RANGE = (0.0, 5.0)
+SCAN_STEP = 0.5
+
+
+def _off_grid(r):
+    return abs(r / SCAN_STEP - round(r / SCAN_STEP)) > 0.02
+
+
+def random_polynomial(seed, n_min=1, n_max=4, separation=0.6, x_range=X_RANGE, close_pair=False, on_grid=False):
+    # Simple roots at least `separation` apart, kept away from the ends and from the 0.5 scan grid.
+    # With close_pair, two of them share one scan cell (no sign change between its ends).
+    # With on_grid, one sits exactly on a scan point, half the time with a partner in the cell after it
+    rng = np.random.default_rng(seed)
+    n = int(rng.integers(max(n_min, 2) if close_pair else n_min, n_max + 1))
+    roots = []
+    cells = round((x_range[1] - x_range[0]) / SCAN_STEP)
+    if close_pair:
+        cell = x_range[0] + SCAN_STEP * int(rng.integers(1, cells - 1))
+        gap = float(rng.uniform(0.05, 0.3))
+        left = float(rng.uniform(cell + 0.03, cell + SCAN_STEP - 0.03 - gap))
+        roots = [left, left + gap]
+    elif on_grid:
+        point = x_range[0] + SCAN_STEP * int(rng.integers(1, cells - 1))
+        roots = [point]
+        if rng.random() < 0.5:
+            roots.append(point + float(rng.uniform(0.05, SCAN_STEP - 0.05)))
+        n = max(n, len(roots))
+    while len(roots) < n:
+        r = float(rng.uniform(x_range[0] + 0.2, x_range[1] - 0.2))
+        if _off_grid(r) and all(abs(r - s) >= separation for s in roots):
+            roots.append(r)
+    roots.sort()
+    scale = float(rng.choice([-1.0, 1.0]) * rng.uniform(0.5, 2.0))
+    coeffs = scale * np.poly(roots)
+    dcoeffs = np.polyder(coeffs)
+    return (lambda x: np.polyval(coeffs, x)), (lambda x: np.polyval(dcoeffs, x)), roots
+
+
+def assert_roots_match(found, expected, tol):
+    found = sorted(found)
+    assert len(found) == len(expected), f"found {found}, expected {expected}"
+    for r, e in zip(found, expected):
+        assert abs(r - e) <= tol, f"found {found}, expected {expected}"
+
+
+def in_range(roots, x_range=X_RANGE):
+    return [r for r in roots if x_range[0] <= r <= x_range[1]]
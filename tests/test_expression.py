@@ -0,0 +1,70 @@
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from methods.expression import compile_expression, run_with_timeout, MAX_LENGTH, MAX_RUNAWAY
+
+
+@pytest.mark.parametrize("text", [
+    "__import__('os').system('ls')",
+    "x.__class__",
+    "open('/etc/passwd')",
+    "lambda: x",
+    "[x for x in range(10)]",
+    "y + 1",
+    "x**10**10",
+    "10**10**10",
+    "x**x**x**x**x",
+    "1" * 40 + " + x",
+    "x + " * MAX_LENGTH + "x",
+    "sin(x, 2)",
+    "'text'",
+    "",
+])
+def test_rejects_unsafe_or_oversized_expressions(text):
+    with pytest.raises(ValueError):
+        compile_expression(text)
+
+
+def test_rejects_expression_over_cost_budget():
+    with pytest.raises(ValueError, match="operations per evaluation"):
+        compile_expression("sin(x)**2 + cos(x)", max_cost=2)
+
+
+@pytest.mark.parametrize("text, x, expected", [
+    ("x^2 - 2", 3.0, 7.0),
+    ("2*x + 1", 1.5, 4.0),
+    ("exp(x) - E**x", 0.7, 0.0),
+    ("sin(pi*x)", 0.5, 1.0),
+    ("Abs(x) - sqrt(x**2)", -2.0, 0.0),
+])
+def test_accepts_calculator_syntax(text, x, expected):
+    f, df, _, _ = compile_expression(text)
+    assert f(x) == pytest.approx(expected, abs=1e-12)
+    assert np.isfinite(df(x))
+
+
+def test_long_flat_sums_are_not_nested():
+    text = ' + '.join(f'{k}*x**{k % 9}' for k in range(1, 43))
+    f, _, _, _ = compile_expression(text)
+    assert f(1.0) == pytest.approx(sum(range(1, 43)))
+
+
+@pytest.mark.parametrize("text", ["x % 2", "x // 2", "x & 1", "~x"])
+def test_rejects_operators_outside_the_grammar(text):
+    with pytest.raises(ValueError, match="not allowed"):
+        compile_expression(text)
+
+
+def test_runaway_workers_are_capped():
+    release = threading.Event()
+    for _ in range(MAX_RUNAWAY):
+        with pytest.raises(TimeoutError, match="took longer"):
+            run_with_timeout(release.wait, 0.01, "parsing")
+    with pytest.raises(TimeoutError, match="still being processed"):
+        run_with_timeout(lambda: 1, 1.0, "parsing")
+    release.set()
+    time.sleep(0.05)
+    assert run_with_timeout(lambda: 1, 1.0, "parsing") == 1
@@ -0,0 +1,261 @@
+import csv
+import os
+
+import numpy as np
+import pytest
+from sympy import lambdify, Symbol
+
+from methods.newton_raphson import newton_raphson_method, newton_raphson_all_roots, newton_raphson_seeded_roots, \
+    NEWTON_RAPHSON_COLUMNS
+from methods.secant import secant_all_roots, secant_seeded_roots
+from methods.bisection import bisection_all_roots, BISECTION_COLUMNS
+from methods.chebyshev import chebyshev_roots
+from methods.sweep import newton_sweep, secant_sweep, sweep_roots, SWEEP_COLUMNS
+from methods.systems import compile_system, newton_system, broyden_system, system_all_roots, system_columns, \
+    starting_grid, MAX_STARTS
+from methods.expression import compile_expression, parse_expression
+from methods import export
+from methods.export import TraceWriter, pq, trace_sink, _trace_bytes
+
+from tests.polynomials import X_RANGE, in_range
+
+
+def _same_roots(a, b, tol):
+    a, b = sorted(a), sorted(b)
+    return len(a) == len(b) and all(abs(x - y) <= tol for x, y in zip(a, b))
+
+
+def _covers(a, b, tol):
+    return all(any(abs(x - y) <= tol for x in a) for y in b)
+
+
+# --- Seeded launches vs the blind grid ---
+def test_seeded_newton_matches_blind_grid(polynomial):
+    f, df, _ = polynomial
+    blind, _ = newton_raphson_all_roots(f, df, X_RANGE)
+    seeded, _, _ = newton_raphson_seeded_roots(f, df, X_RANGE)
+    assert _same_roots(seeded, in_range(blind), 1e-6)
+
+
+def test_seeded_secant_matches_blind_grid(polynomial):
+    f, _, _ = polynomial
+    blind, _ = secant_all_roots(f, X_RANGE)
+    seeded, _, _ = secant_seeded_roots(f, X_RANGE)
+    assert _same_roots(seeded, in_range(blind), 1e-6)
+
+
+# A root on a scan point: the blind grid starts right on it and can step over a partner in the
+# same cell, so the seeded scan must find every blind root plus the true set
+def test_seeded_newton_matches_blind_grid_on_grid(on_grid):
+    f, df, expected = on_grid
+    blind, _ = newton_raphson_all_roots(f, df, X_RANGE)
+    seeded, _, _ = newton_raphson_seeded_roots(f, df, X_RANGE)
+    assert _covers(seeded, in_range(blind), 1e-6)
+    assert _same_roots(seeded, expected, 1e-6)
+
+
+def test_seeded_secant_matches_blind_grid_on_grid(on_grid):
+    f, _, expected = on_grid
+    blind, _ = secant_all_roots(f, X_RANGE)
+    seeded, _, _ = secant_seeded_roots(f, X_RANGE)
+    assert _covers(seeded, in_range(blind), 1e-6)
+    assert _same_roots(seeded, expected, 1e-6)
+
+
+def test_chebyshev_matches_bisection(polynomial):
+    f, df, _ = polynomial
+    reference, _ = bisection_all_roots(f, X_RANGE)
+    roots, _, _ = chebyshev_roots(f, X_RANGE, df)
+    assert _same_roots(roots, reference, 1e-4)
+
+
+# --- Vectorized parameter sweeps vs one scalar solve per parameter ---
+SWEEP_EXPR = "x**3 - 2*x - p"
+
+
+@pytest.fixture(scope="module")
+def sweep_functions():
+    f, df, _, _ = compile_expression(SWEEP_EXPR, ('x', 'p'))
+    return f, df
+
+
+def test_newton_sweep_matches_scalar_newton(sweep_functions):
+    f, df = sweep_functions
+    params = np.linspace(-1, 1, 41)
+    x, converged, _ = newton_sweep(f, df, params, 2.0)
+    assert converged.all()
+    for p, xv in zip(params, x):
+        root, _ = newton_raphson_method(lambda t: f(t, p), lambda t: df(t, p), 2.0, tol=1e-12)
+        assert abs(root - xv) <= 1e-9
+
+
+def test_secant_sweep_matches_newton_sweep(sweep_functions):
+    f, df = sweep_functions
+    params = np.linspace(-1, 1, 41)
+    x_newton, _, _ = newton_sweep(f, df, params, 2.0)
+    x_secant, converged, _ = secant_sweep(f, params, 2.0)
+    assert converged.all()
+    np.testing.assert_allclose(x_secant, x_newton, atol=1e-9)
+
+
+def test_sweep_branches_are_roots(sweep_functions):
+    f, df = sweep_functions
+    params = np.linspace(-1, 1, 201)
+    start_roots, branches = sweep_roots(f, df, params, (-3, 3))
+    assert len(start_roots) == 3
+    for _, roots, converged, _ in branches:
+        assert converged.all()
+        np.testing.assert_allclose(f(roots, params), 0, atol=1e-8)
+
+
+@pytest.mark.parametrize("method", ["newton", "secant"])
+def test_sweep_finds_branches_appearing_inside_the_grid(method):
+    f, df, _, _ = compile_expression("x**3 - x - p", variables=('x', 'p'))
+    params = np.linspace(-1, 1, 401)
+    _, branches = sweep_roots(f, df, params, (-3, 3), method=method)
+    assert len(branches) == 3
+    # the fold at p = ±2/(3√3) ≈ ±0.385 creates the two right-hand branches mid-sweep
+    covered = np.zeros(params.size, dtype=int)
+    for _, roots, converged, _ in branches:
+        np.testing.assert_allclose(f(roots[converged], params[converged]), 0, atol=1e-8)
+        covered += converged
+    inside = np.abs(params) < 0.38
+    assert (covered[inside] == 3).all()
+    assert (covered[np.abs(params) > 0.39] == 1).all()
+
+
+# --- Batched systems vs one start at a time ---
+@pytest.fixture(scope="module")
+def circle_line():
+    F, J, _, _ = compile_system(["x**2 + y**2 - 4", "x - y - 1"], ('x', 'y'))
+    return F, J
+
+
+@pytest.mark.parametrize("solver", [newton_system, broyden_system])
+def test_batched_system_matches_single_starts(circle_line, solver):
+    F, J = circle_line
+    X0 = np.random.default_rng(1).uniform(-3, 3, (64, 2))
+    X, converged, _, _ = solver(F, J, X0)
+    for k, x0 in enumerate(X0):
+        x, c, _, _ = solver(F, J, x0)
+        assert c[0] == converged[k]
+        if c[0]:
+            np.testing.assert_allclose(x[0], X[k], atol=1e-8)
+
+
+def test_system_roots_independent_of_batch_size(circle_line):
+    F, J = circle_line
+    X0 = np.random.default_rng(2).uniform(-3, 3, (50, 2))
+    whole, rows_whole, _ = system_all_roots(F, J, X0)
+    chunked, rows_chunked, _ = system_all_roots(F, J, X0, batch_size=7)
+    assert len(whole) == len(chunked) == 2
+    assert sorted(r[:2] for r in rows_whole) == sorted(r[:2] for r in rows_chunked)
+
+
+# --- Streaming sinks vs in-memory tables ---
+def _read_csv(path):
+    with open(path, newline='', encoding='utf-8') as fh:
+        return list(csv.reader(fh))
+
+
+def test_sink_writes_same_rows_as_table(polynomial, tmp_path):
+    f, df, _ = polynomial
+    roots, table = newton_raphson_all_roots(f, df, X_RANGE)
+    path = tmp_path / "trace.csv"
+    with TraceWriter(path, NEWTON_RAPHSON_COLUMNS, chunk_size=7) as sink:
+        streamed, rest = newton_raphson_all_roots(f, df, X_RANGE, sink=sink)
+    assert streamed == roots and rest == []
+    rows = _read_csv(path)
+    assert rows[0] == NEWTON_RAPHSON_COLUMNS
+    assert len(rows) - 1 == len(table)
+    for written, row in zip(rows[1:], table):
+        assert [float(v) if v else None for v in written] == pytest.approx(
+            [float(v) if v is not None else None for v in row])
+
+
+@pytest.mark.skipif(pq is None, reason="pyarrow not installed")
+def test_parquet_sink_matches_csv_sink(tmp_path):
+    f, _, _, _ = compile_expression("x**3 - 2*x - 5")
+    paths = {fmt: tmp_path / f"trace.{fmt}" for fmt in ('csv', 'parquet')}
+    for path in paths.values():
+        with TraceWriter(path, BISECTION_COLUMNS, chunk_size=5) as sink:
+            bisection_all_roots(f, (-5, 5), sink=sink)
+    table = pq.read_table(paths['parquet']).to_pylist()
+    rows = _read_csv(paths['csv'])[1:]
+    assert len(table) == len(rows)
+    for record, row in zip(table, rows):
+        assert record["Remark"] == row[-1]
+        assert [record[c] for c in BISECTION_COLUMNS[:-1]] == pytest.approx([float(v) for v in row[:-1]])
+
+
+def test_sweep_sink_writes_every_branch_point(sweep_functions, tmp_path):
+    f, df = sweep_functions
+    params = np.linspace(-1, 1, 101)
+    path = tmp_path / "sweep.csv"
+    with TraceWriter(path, SWEEP_COLUMNS) as sink:
+        start_roots, _ = sweep_roots(f, df, params, (-3, 3), sink=sink)
+    assert len(_read_csv(path)) - 1 == len(start_roots) * params.size
+
+
+def test_download_streams_the_solver_only_when_called(polynomial, tmp_path):
+    f, df, _ = polynomial
+    _, table, _ = newton_raphson_seeded_roots(f, df, X_RANGE)
+    f.reset()
+    run = lambda sink: newton_raphson_seeded_roots(f, df, X_RANGE, sink=sink)
+    data = _trace_bytes(run, NEWTON_RAPHSON_COLUMNS, "newton_raphson", 'csv')
+    assert f.calls > 0
+    path = tmp_path / "download.csv"
+    path.write_bytes(data)
+    assert len(_read_csv(path)) - 1 == len(table)
+
+
+def test_trace_sink_stays_in_trace_dir(monkeypatch, tmp_path):
+    monkeypatch.setattr(export, "TRACE_DIR", str(tmp_path / "traces"))
+    with trace_sink("", ["x"]) as sink:
+        assert sink is None
+    with trace_sink("../../elsewhere/run.csv", ["x"]) as sink:
+        sink.write([1.0])
+    assert (tmp_path / "traces" / "run.csv").exists() and sink.rows_written == 1
+    with pytest.raises(ValueError):
+        trace_sink("run.txt", ["x"])
+
+
+def test_trace_sink_never_overwrites(monkeypatch, tmp_path):
+    monkeypatch.setattr(export, "TRACE_DIR", str(tmp_path))
+    paths = []
+    for value in (1.0, 2.0, 3.0):
+        with trace_sink("run.csv", ["x"]) as sink:
+            sink.write([value])
+        paths.append(sink.path)
+    assert [os.path.basename(p) for p in paths] == ["run.csv", "run-1.csv", "run-2.csv"]
+    assert [_read_csv(p)[1] for p in paths] == [["1.0"], ["2.0"], ["3.0"]]
+
+
+def test_system_columns_match_rows(circle_line):
+    F, J = circle_line
+    _, rows, _ = system_all_roots(F, J, [[1.0, 1.0]])
+    assert all(len(r) == len(system_columns(('x', 'y'))) for r in rows)
+
+
+def test_starting_grid_is_capped():
+    assert len(starting_grid((0, 1), 6, 2)) == 36
+    assert len(starting_grid((0, 1), 200, 3, max_starts=5000)) == 17 ** 3
+    assert len(starting_grid((0, 1), 200, 3)) <= MAX_STARTS
+    assert len(starting_grid((0, 1), 10, 2, max_starts=100)) == 100
+
+
+# --- CSE-compiled callables vs plain lambdify ---
+@pytest.mark.parametrize("text", [
+    "x**3 - 2*x - 5",
+    "sin(x)**2 + sin(x)*cos(x) - exp(-x)",
+    "sqrt(1 + x**2) - log(1 + x**2) - 1",
+    "tanh(x) + x*exp(-x**2)",
+])
+def test_cse_compilation_matches_plain_lambdify(text):
+    f, df, f_expr, df_expr = compile_expression(text)
+    x = Symbol('x', real=True)
+    X = np.linspace(-3, 3, 101)
+    np.testing.assert_allclose(f(X), lambdify(x, f_expr, 'numpy')(X), rtol=1e-12, atol=1e-12)
+    np.testing.assert_allclose(df(X), lambdify(x, df_expr, 'numpy')(X), rtol=1e-12, atol=1e-12)
+    assert parse_expression(text) == f_expr
+
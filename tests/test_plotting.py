@@ -0,0 +1,79 @@
+import gc
+
+import matplotlib
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+from matplotlib.axes import Axes
+from matplotlib.figure import Figure
+
+from methods import plotting
+from methods.plotting import FIGURES, POOL_SIZE, cyberpunk_plot, plot_function_roots, palette
+
+
+@pytest.fixture
+def images(monkeypatch):
+    rendered = []
+    monkeypatch.setattr(plotting.st, "image", lambda data, **kwargs: rendered.append(data))
+    return rendered
+
+
+def _plot(n_roots=3):
+    f = lambda x: x**3 - 2*x - 1
+    X = np.linspace(-2, 2, 500)
+    with cyberpunk_plot("Function Plot with Detected Roots") as ax:
+        plot_function_roots(ax, f, X, f(X), list(np.linspace(-1.5, 1.5, n_roots)))
+
+
+def test_renders_fixed_size_png(images):
+    _plot(1)
+    _plot(8)
+    sizes = {(int.from_bytes(png[16:20], 'big'), int.from_bytes(png[20:24], 'big')) for png in images}
+    assert sizes == {(plotting.FIGSIZE[0] * plotting.RENDER_DPI, plotting.FIGSIZE[1] * plotting.RENDER_DPI)}
+
+
+def test_rendering_is_deterministic(images):
+    _plot()
+    _plot()
+    assert images[0] == images[1]
+
+
+def test_no_global_side_effects(images):
+    rc = dict(matplotlib.rcParams)
+    _plot()
+    assert plt.get_fignums() == []
+    assert dict(matplotlib.rcParams) == rc
+
+
+def test_figure_is_returned_to_pool_on_error(images):
+    created = FIGURES.created
+    for _ in range(2 * POOL_SIZE):
+        with pytest.raises(ZeroDivisionError):
+            with cyberpunk_plot("broken"):
+                1 / 0
+    assert FIGURES.created - created <= 1
+    assert images == []
+
+
+def _live(kind):
+    gc.collect()
+    return sum(isinstance(o, kind) for o in gc.get_objects())
+
+
+def test_memory_stays_flat_over_many_runs(images, monkeypatch):
+    monkeypatch.setattr(plotting, "RENDER_DPI", 20)
+    _plot()
+    figures, axes = _live(Figure), _live(Axes)
+    for _ in range(100):
+        _plot()
+        images.clear()
+    assert FIGURES.created <= POOL_SIZE
+    assert _live(Figure) == figures
+    assert _live(Axes) == axes
+    assert all(not fig.axes for fig in FIGURES._free.queue)
+
+
+def test_palette_has_one_color_per_item():
+    assert palette(0) == []
+    assert len(set(palette(5))) == 5
+    assert palette(3, 'cool') == palette(3, 'cool')
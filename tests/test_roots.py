@@ -0,0 +1,228 @@
+import numpy as np
+import pytest
+
+from methods.bisection import bisection_all_roots
+from methods.regula_falsi import regula_falsi_all_roots
+from methods.newton_raphson import newton_raphson_all_roots, newton_raphson_seeded_roots
+from methods.secant import secant_all_roots, secant_seeded_roots
+from methods.incremental import incremental_search
+from methods.graphical import find_graphical_roots
+from methods.chebyshev import chebyshev_roots
+from methods.interval_newton import interval_function, interval_newton_roots
+from methods.expression import compile_expression
+
+from tests.polynomials import X_RANGE, assert_roots_match, in_range
+
+
+def test_bisection(polynomial):
+    f, _, expected = polynomial
+    roots, _ = bisection_all_roots(f, X_RANGE)
+    assert_roots_match(roots, expected, 1e-4)
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("1e9*(x - 1.23456789)", [1.23456789]),
+    ("1e12*(x - 2.00001)**3", [2.00001]),
+    ("1/(x - 2.3)", []),
+    ("tan(x)", [0.0, np.pi]),
+])
+def test_bisection_separates_steep_roots_from_poles(text, expected):
+    f, _, _, _ = compile_expression(text)
+    roots, _ = bisection_all_roots(f, X_RANGE)
+    assert_roots_match(roots, expected, 1e-4)
+
+def test_regula_falsi(polynomial):
+    f, _, expected = polynomial
+    roots, _ = regula_falsi_all_roots(f, X_RANGE)
+    assert_roots_match(roots, expected, 1e-4)
+
+
+def test_newton_raphson(polynomial):
+    f, df, expected = polynomial
+    roots, _ = newton_raphson_all_roots(f, df, X_RANGE)
+    assert_roots_match(in_range(roots), expected, 1e-6)
+
+
+def test_secant(polynomial):
+    f, _, expected = polynomial
+    roots, _ = secant_all_roots(f, X_RANGE)
+    assert_roots_match(in_range(roots), expected, 1e-6)
+
+
+def test_incremental_search(polynomial):
+    f, _, expected = polynomial
+    roots, _ = incremental_search(f, X_RANGE, dx=0.001)
+    assert_roots_match(roots, expected, 1e-3)
+
+
+def test_graphical(polynomial):
+    f, _, expected = polynomial
+    roots, _, _, _ = find_graphical_roots(f, X_RANGE, resolution=1000)
+    assert_roots_match(roots, expected, (X_RANGE[1] - X_RANGE[0]) / 1000)
+
+
+def test_newton_raphson_seeded(polynomial):
+    f, df, expected = polynomial
+    roots, _, _ = newton_raphson_seeded_roots(f, df, X_RANGE)
+    assert_roots_match(roots, expected, 1e-6)
+
+
+def test_secant_seeded(polynomial):
+    f, _, expected = polynomial
+    roots, _, _ = secant_seeded_roots(f, X_RANGE)
+    assert_roots_match(roots, expected, 1e-6)
+
+
+# Two roots either side of an extremum inside one scan cell
+@pytest.mark.parametrize("text, expected", [
+    ("(x - 2.2)**2 - 0.01", [2.1, 2.3]),
+    ("(x - 2.25)**2 - 0.0025", [2.2, 2.3]),
+    ("(x - 2.05)**2 - 0.0004", [2.03, 2.07]),
+    ("(x - 1.3)**2*(x - 3.7)", [1.3, 3.7]),
+    # Extremum far from where f' interpolates it, and |f| still falling across the pair
+    ("(x - 1.5601)*(x - 1.6599)*(x - 2.3129)*(x - 3.2047)", [1.5601, 1.6599, 2.3129, 3.2047]),
+    ("(x - 1.696)*(x - 1.847)*(x - 2.529)", [1.696, 1.847, 2.529]),
+])
+def test_seeded_launches_find_roots_around_extrema(text, expected):
+    f, df, _, _ = compile_expression(text)
+    newton, _, _ = newton_raphson_seeded_roots(f, df, X_RANGE)
+    secant, _, _ = secant_seeded_roots(f, X_RANGE)
+    assert_roots_match(newton, expected, 1e-6)
+    assert_roots_match(secant, expected, 1e-6)
+
+
+# A root exactly on a scan point, with another root in the rest of its cell
+@pytest.mark.parametrize("text, x_range, expected", [
+    ("(x - 1)*(x - 1.2)*(x - 3)", (0, 5), [1, 1.2, 3]),
+    ("x*(x - 0.3)", (-1, 1), [0, 0.3]),
+    ("(x - 1)*(x - 1.1)", (0, 3), [1, 1.1]),
+    ("(x - 1)**2*(x - 1.2)", (0, 5), [1, 1.2]),
+])
+def test_seeded_launches_search_past_an_exact_zero(text, x_range, expected):
+    f, df, _, _ = compile_expression(text)
+    newton, _, _ = newton_raphson_seeded_roots(f, df, x_range)
+    secant, _, _ = secant_seeded_roots(f, x_range)
+    assert_roots_match(newton, expected, 1e-6)
+    assert_roots_match(secant, expected, 1e-6)
+
+
+@pytest.mark.parametrize("text, x_range, expected", [
+    ("1e9*(x - 1.23456789)", X_RANGE, [1.23456789]),
+    ("1e12*(x - 2.00001)**3", X_RANGE, [2.00001]),
+    ("1/(x - 2.3)", X_RANGE, []),
+    ("tan(x)", (-1, 5), [0.0, np.pi]),
+    # The root near 7.725 shares its scan cell with the pole at 5π/2: no sign change to seed it
+    ("tan(x) - x", (0, 10), [0.0, 4.493409457909064]),
+])
+def test_seeded_launches_separate_steep_roots_from_poles(text, x_range, expected):
+    f, df, _, _ = compile_expression(text)
+    newton, _, _ = newton_raphson_seeded_roots(f, df, x_range)
+    secant, _, _ = secant_seeded_roots(f, x_range)
+    assert_roots_match(newton, expected, 1e-6)
+    assert_roots_match(secant, expected, 1e-6)
+
+
+def test_chebyshev(polynomial):
+    f, df, expected = polynomial
+    roots, _, _ = chebyshev_roots(f, X_RANGE, df)
+    assert_roots_match(roots, expected, 1e-9)
+
+
+def test_newton_raphson_seeded_close_pair(close_pair):
+    f, df, expected = close_pair
+    roots, _, _ = newton_raphson_seeded_roots(f, df, X_RANGE)
+    assert_roots_match(roots, expected, 1e-6)
+
+
+def test_secant_seeded_close_pair(close_pair):
+    f, _, expected = close_pair
+    roots, _, _ = secant_seeded_roots(f, X_RANGE)
+    assert_roots_match(roots, expected, 1e-6)
+
+
+def test_chebyshev_close_pair(close_pair):
+    f, df, expected = close_pair
+    roots, _, _ = chebyshev_roots(f, X_RANGE, df)
+    assert_roots_match(roots, expected, 1e-9)
+
+
+def test_newton_raphson_seeded_on_grid(on_grid):
+    f, df, expected = on_grid
+    roots, _, _ = newton_raphson_seeded_roots(f, df, X_RANGE)
+    assert_roots_match(roots, expected, 1e-6)
+
+
+def test_secant_seeded_on_grid(on_grid):
+    f, _, expected = on_grid
+    roots, _, _ = secant_seeded_roots(f, X_RANGE)
+    assert_roots_match(roots, expected, 1e-6)
+
+
+@pytest.mark.parametrize("text, x_range, expected", [
+    ("exp(x) - 1e6", (0, 50), [np.log(1e6)]),
+    ("tan(x)", (0, 5), [0.0, np.pi]),
+    ("1/(x - 2.3)", (0, 5), []),
+    ("sqrt(x) - 1", (-1, 3), [1.0]),
+])
+def test_chebyshev_reports_only_verified_roots(text, x_range, expected):
+    f, df, _, _ = compile_expression(text)
+    with np.errstate(all='ignore'):
+        roots, _, _ = chebyshev_roots(f, x_range, df)
+    assert_roots_match(roots, expected, 1e-8)
+
+
+def test_interval_newton_certifies_every_root():
+    rng = np.random.default_rng(0)
+    for _ in range(10):
+        expected = sorted(np.round(rng.uniform(0.2, 4.8, 3), 3))
+        if min(np.diff(expected)) < 0.05:
+            continue
+        text = '*'.join(f"(x - {r})" for r in expected)
+        _, _, f_expr, df_expr = compile_expression(text)
+        enclosures, unresolved, _ = interval_newton_roots(interval_function(f_expr), interval_function(df_expr), X_RANGE)
+        assert not unresolved
+        assert len(enclosures) == len(expected)
+        for X, r in zip(enclosures, expected):
+            assert X.lo <= r <= X.hi
+
+
+def test_interval_newton_reports_double_root_as_unresolved():
+    _, _, f_expr, df_expr = compile_expression("(x - 1.3)**2*(x - 3.7)")
+    enclosures, unresolved, _ = interval_newton_roots(interval_function(f_expr), interval_function(df_expr), X_RANGE)
+    assert [round(X.mid, 8) for X in enclosures] == [3.7]
+    assert len(unresolved) == 1 and unresolved[0].lo <= 1.3 <= unresolved[0].hi
+
+
+def _interval_roots(text, x_range):
+    _, _, f_expr, df_expr = compile_expression(text)
+    return interval_newton_roots(interval_function(f_expr), interval_function(df_expr), x_range)
+
+
+def test_interval_newton_does_not_contract_across_poles():
+    enclosures, unresolved, _ = _interval_roots("tan(x)", (-1, 5))
+    assert [round(X.mid, 8) for X in enclosures] == [0.0, round(np.pi, 8)]
+    assert [round(X.mid, 6) for X in unresolved] == [round(np.pi / 2, 6), round(3 * np.pi / 2, 6)]
+    enclosures, unresolved, _ = _interval_roots("1/(x - 2.3)", X_RANGE)
+    assert not enclosures and len(unresolved) == 1 and unresolved[0].contains(2.3)
+
+
+@pytest.mark.parametrize("text, x_range, expected", [
+    ("x", (0, 5), [0.0]),
+    ("x - 5", (0, 5), [5.0]),
+    ("sin(x)", (0, 7), [0.0, np.pi, 2 * np.pi]),
+])
+def test_interval_newton_certifies_endpoint_roots(text, x_range, expected):
+    enclosures, unresolved, _ = _interval_roots(text, x_range)
+    assert not unresolved
+    assert len(enclosures) == len(expected)
+    for X, r in zip(enclosures, expected):
+        assert X.lo - 1e-12 <= r <= X.hi + 1e-12
+
+
+def test_transcendental_roots_agree():
+    f, df, _, _ = compile_expression("sin(x) - x/10")
+    expected = [-8.42320393, -7.06817436, -2.85234189, 0.0, 2.85234189, 7.06817436, 8.42320393]
+    cheb, _, _ = chebyshev_roots(f, (-20, 20), df)
+    seeded, _, _ = newton_raphson_seeded_roots(f, df, (-20, 20))
+    assert_roots_match(cheb, expected, 1e-7)
+    assert_roots_match(seeded, expected, 1e-7)